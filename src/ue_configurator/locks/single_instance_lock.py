@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import contextlib
+import functools
 import getpass
 import json
 import os
@@ -16,6 +16,33 @@ from pathlib import Path
 from typing import Dict, Optional, Sequence
 
 
+if os.name == "nt":  # pragma: no cover - Windows only
+    import ctypes
+    from ctypes import wintypes
+
+    # One declared handle at import; per-call WinDLL construction would
+    # reload the library wrapper and re-infer argtypes every PID probe.
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    _kernel32.OpenProcess.restype = wintypes.HANDLE
+    _kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    _kernel32.CloseHandle.restype = wintypes.BOOL
+else:
+    _kernel32 = None
+
+
+@functools.lru_cache(maxsize=8)
+def _lock_path(name: str, directory: Optional[Path]) -> Path:
+    """Resolve the lock file once per (name, directory) pair.
+
+    gettempdir() reads environment variables on first use and the joined
+    Path never changes within a process, so repeat acquires reuse it.
+    """
+
+    base = directory if directory is not None else Path(tempfile.gettempdir())
+    return base / f"{name}.lock"
+
+
 class SingleInstanceError(RuntimeError):
     """Raised when another process already holds the lock."""
 
@@ -41,16 +68,17 @@ def _pid_exists(pid: int) -> bool:
     """Best-effort PID existence check on Windows and POSIX."""
     if pid <= 0:
         return False
-    if os.name == "nt":
+    if _kernel32 is not None:
         try:
-            import ctypes
-
             PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
-            handle = ctypes.windll.kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+            ERROR_ACCESS_DENIED = 5
+            handle = _kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
             if handle:
-                ctypes.windll.kernel32.CloseHandle(handle)
+                _kernel32.CloseHandle(handle)
                 return True
-            return False
+            # Read the error before any further ctypes call can clobber it;
+            # access-denied still proves the process exists.
+            return ctypes.get_last_error() == ERROR_ACCESS_DENIED
         except Exception:
             return True
     try:
@@ -153,7 +181,161 @@ def _restore_signal_handlers(previous):
             continue
 
 
-@contextlib.contextmanager
+class SingleInstanceLock:
+    """Context manager guarding against concurrent uecfg runs.
+
+    A plain ``__enter__``/``__exit__`` class rather than a generator-based
+    ``@contextmanager``: no generator frame on the startup path, and
+    acquisition failures raise from the line that actually failed.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        log_path: Optional[Path] = None,
+        *,
+        lock_dir: Optional[Path] = None,
+        repo_root: Optional[Path] = None,
+        command: Optional[Sequence[str]] = None,
+        tool_version: Optional[str] = None,
+    ) -> None:
+        self._name = name
+        self._log_path = log_path
+        self._lock_dir = lock_dir
+        self._repo_root = repo_root
+        self._command = command
+        self._tool_version = tool_version
+        self._lock_file: Optional[Path] = None
+        self._owned = False
+        self._previous_handlers: Dict[object, object] = {}
+
+    def _cleanup(self) -> None:
+        if not self._owned:
+            return
+        self._owned = False
+        try:
+            self._lock_file.unlink()
+        except FileNotFoundError:
+            return
+        except OSError:
+            return
+
+    def __enter__(self) -> "SingleInstanceLock":
+        log_path = self._log_path
+        repo_root = self._repo_root
+        directory = self._lock_dir if isinstance(self._lock_dir, Path) or not self._lock_dir else Path(self._lock_dir)
+        lock_file = _lock_path(self._name, directory)
+        lock_file.parent.mkdir(parents=True, exist_ok=True)
+        self._lock_file = lock_file
+        current_metadata = _build_metadata(
+            name=self._name,
+            repo_root=repo_root,
+            command=self._command,
+            tool_version=self._tool_version,
+        )
+
+        while True:
+            try:
+                # O_CLOEXEC/non-inheritable keeps the lock fd out of spawned
+                # subprocesses (UBT, shader workers), which would otherwise
+                # hold the lock alive after a crash of this process.
+                flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_CLOEXEC", 0)
+                fd = os.open(lock_file, flags)
+                os.set_inheritable(fd, False)
+                try:
+                    os.write(fd, json.dumps(current_metadata, indent=2).encode("utf-8"))
+                finally:
+                    os.close(fd)
+                _write_conflict_log(log_path, f"Lock acquired at {lock_file} by PID {os.getpid()}")
+                self._owned = True
+                self._previous_handlers = _install_signal_cleanup(self._cleanup)
+                return self
+            except FileExistsError:
+                metadata = _load_lock_metadata(lock_file) or {}
+                holder_pid_value = metadata.get("pid")
+                holder_pid = holder_pid_value if isinstance(holder_pid_value, int) else None
+                holder_host = str(metadata.get("hostname", ""))
+                holder_repo = metadata.get("repo_root")
+
+                current_host = platform.node()
+                current_repo = str((repo_root or _detect_repo_root()).resolve())
+
+                stale_reason = None
+                if isinstance(holder_pid, int) and not _pid_exists(holder_pid):
+                    stale_reason = f"PID {holder_pid} is not running"
+                elif holder_host and holder_host != current_host:
+                    stale_reason = f"hostname differs (lock on {holder_host}, current {current_host})"
+                elif holder_repo and holder_repo != current_repo:
+                    stale_reason = f"repo root differs (lock at {holder_repo}, current {current_repo})"
+
+                if stale_reason:
+                    msg = f"Stale lock detected ({stale_reason}) - recovering automatically."
+                    print(msg)
+                    _write_conflict_log(log_path, msg)
+                    try:
+                        lock_file.unlink()
+                    except OSError:
+                        raise SingleInstanceError(
+                            f"Unable to clear stale lock at {lock_file}. Please remove it manually.",
+                            lock_file,
+                        )
+                    continue
+
+                interactive = sys.stdin.isatty()
+                details = _format_lock_details(metadata)
+                if not interactive:
+                    message = (
+                        "Another instance appears to be running. "
+                        f"Lock file: {lock_file}. {details or 'Existing lock metadata unavailable.'} "
+                        "If this seems stale, rerun interactively or remove the lock once the other process is finished."
+                    )
+                    _write_conflict_log(log_path, message)
+                    raise SingleInstanceError(message, lock_file)
+
+                print("Another instance appears to be running.")
+                if details:
+                    print(f"Details: {details}")
+                print("Options:")
+                print("  1) Exit (recommended)")
+                print("  2) Remove stale lock and restart")
+                print("  3) Continue in read-only / scan mode")
+
+                choice = ""
+                while True:
+                    choice = input("Select an option [1]: ").strip()
+                    if choice in ("", "1", "2", "3"):
+                        break
+                    print("Please enter 1, 2, or 3.")
+
+                if choice in ("", "1"):
+                    message = "Exiting because another instance is active."
+                    _write_conflict_log(log_path, f"{message} {details}")
+                    raise SingleInstanceError(message, lock_file)
+
+                if choice == "2":
+                    decision_msg = "User chose to remove existing lock and continue."
+                    _write_conflict_log(log_path, f"{decision_msg} {details}")
+                    try:
+                        lock_file.unlink()
+                    except OSError:
+                        raise SingleInstanceError(
+                            f"Unable to remove existing lock at {lock_file}. Please delete it manually.",
+                            lock_file,
+                        )
+                    continue
+
+                decision_msg = "User chose to continue without acquiring the lock (read-only/scan mode)."
+                _write_conflict_log(log_path, f"{decision_msg} {details}")
+                return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if self._previous_handlers:
+            _restore_signal_handlers(self._previous_handlers)
+            self._previous_handlers = {}
+        self._cleanup()
+        return False
+
+
 def acquire_single_instance_lock(
     name: str,
     log_path: Optional[Path] = None,
@@ -162,120 +344,13 @@ def acquire_single_instance_lock(
     repo_root: Optional[Path] = None,
     command: Optional[Sequence[str]] = None,
     tool_version: Optional[str] = None,
-):
+) -> SingleInstanceLock:
     """Acquire a file lock to avoid concurrent runs."""
-    directory = Path(lock_dir) if lock_dir else Path(tempfile.gettempdir())
-    directory.mkdir(parents=True, exist_ok=True)
-    lock_file = directory / f"{name}.lock"
-    current_metadata = _build_metadata(
-        name=name,
+    return SingleInstanceLock(
+        name,
+        log_path,
+        lock_dir=lock_dir,
         repo_root=repo_root,
         command=command,
         tool_version=tool_version,
     )
-
-    while True:
-        try:
-            fd = os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
-            with os.fdopen(fd, "w", encoding="utf-8") as handle:
-                json.dump(current_metadata, handle, indent=2)
-            _write_conflict_log(log_path, f"Lock acquired at {lock_file} by PID {os.getpid()}")
-            cleanup_done = False
-
-            def _cleanup():
-                nonlocal cleanup_done
-                if cleanup_done:
-                    return
-                cleanup_done = True
-                try:
-                    lock_file.unlink()
-                except FileNotFoundError:
-                    return
-                except OSError:
-                    return
-
-            previous_handlers = _install_signal_cleanup(_cleanup)
-            try:
-                yield
-            finally:
-                _restore_signal_handlers(previous_handlers)
-                _cleanup()
-            return
-        except FileExistsError:
-            metadata = _load_lock_metadata(lock_file) or {}
-            holder_pid_value = metadata.get("pid")
-            holder_pid = holder_pid_value if isinstance(holder_pid_value, int) else None
-            holder_host = str(metadata.get("hostname", ""))
-            holder_repo = metadata.get("repo_root")
-
-            current_host = platform.node()
-            current_repo = str((repo_root or _detect_repo_root()).resolve())
-
-            stale_reason = None
-            if isinstance(holder_pid, int) and not _pid_exists(holder_pid):
-                stale_reason = f"PID {holder_pid} is not running"
-            elif holder_host and holder_host != current_host:
-                stale_reason = f"hostname differs (lock on {holder_host}, current {current_host})"
-            elif holder_repo and holder_repo != current_repo:
-                stale_reason = f"repo root differs (lock at {holder_repo}, current {current_repo})"
-
-            if stale_reason:
-                msg = f"Stale lock detected ({stale_reason}) - recovering automatically."
-                print(msg)
-                _write_conflict_log(log_path, msg)
-                try:
-                    lock_file.unlink()
-                except OSError:
-                    raise SingleInstanceError(
-                        f"Unable to clear stale lock at {lock_file}. Please remove it manually.",
-                        lock_file,
-                    )
-                continue
-
-            interactive = sys.stdin.isatty()
-            details = _format_lock_details(metadata)
-            if not interactive:
-                message = (
-                    "Another instance appears to be running. "
-                    f"Lock file: {lock_file}. {details or 'Existing lock metadata unavailable.'} "
-                    "If this seems stale, rerun interactively or remove the lock once the other process is finished."
-                )
-                _write_conflict_log(log_path, message)
-                raise SingleInstanceError(message, lock_file)
-
-            print("Another instance appears to be running.")
-            if details:
-                print(f"Details: {details}")
-            print("Options:")
-            print("  1) Exit (recommended)")
-            print("  2) Remove stale lock and restart")
-            print("  3) Continue in read-only / scan mode")
-
-            choice = ""
-            while True:
-                choice = input("Select an option [1]: ").strip()
-                if choice in ("", "1", "2", "3"):
-                    break
-                print("Please enter 1, 2, or 3.")
-
-            if choice in ("", "1"):
-                message = "Exiting because another instance is active."
-                _write_conflict_log(log_path, f"{message} {details}")
-                raise SingleInstanceError(message, lock_file)
-
-            if choice == "2":
-                decision_msg = "User chose to remove existing lock and continue."
-                _write_conflict_log(log_path, f"{decision_msg} {details}")
-                try:
-                    lock_file.unlink()
-                except OSError:
-                    raise SingleInstanceError(
-                        f"Unable to remove existing lock at {lock_file}. Please delete it manually.",
-                        lock_file,
-                    )
-                continue
-
-            decision_msg = "User chose to continue without acquiring the lock (read-only/scan mode)."
-            _write_conflict_log(log_path, f"{decision_msg} {details}")
-            yield
-            return
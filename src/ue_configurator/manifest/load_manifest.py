@@ -131,6 +131,7 @@ def load_manifest_from_path(path: Path) -> Manifest:
         notes=payload.get("notes"),
     )
     manifest.fingerprint = _fingerprint(payload)
+    manifest.short_fingerprint = manifest.fingerprint[:12]
     return manifest
 
 
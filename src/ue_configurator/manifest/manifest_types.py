@@ -59,6 +59,8 @@ class Manifest:
     horde_uba: Optional[HordeUBARequirement] = None
     notes: Optional[str] = None
     fingerprint: str = ""
+    # Pre-sliced 12-char prefix; every banner/report/log line uses it.
+    short_fingerprint: str = ""
 
     def describe(self) -> str:
         return f"{self.id} (UE {self.ue_version})"
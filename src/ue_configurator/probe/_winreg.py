@@ -0,0 +1,36 @@
+"""Shared ``winreg`` import guard for the probe modules.
+
+Hoisting the ``try: import winreg`` dance here gives every probe a single
+``HAS_WINREG`` flag plus module-local bindings for the enumeration helpers,
+so hot registry loops skip a ``winreg.`` attribute lookup per subkey.
+"""
+
+from __future__ import annotations
+
+from typing import Final
+
+try:  # pragma: no cover - Windows only
+    import winreg  # type: ignore
+
+    HKLM = winreg.HKEY_LOCAL_MACHINE
+    KEY_READ = winreg.KEY_READ
+    KEY_QUERY_VALUE = winreg.KEY_QUERY_VALUE
+    KEY_WOW64_32KEY = getattr(winreg, "KEY_WOW64_32KEY", 0)
+    KEY_WOW64_64KEY = getattr(winreg, "KEY_WOW64_64KEY", 0)
+    REG_SZ = winreg.REG_SZ
+    OpenKey = winreg.OpenKey
+    QueryInfoKey = winreg.QueryInfoKey
+    QueryValueEx = winreg.QueryValueEx
+    EnumKey = winreg.EnumKey
+    EnumValue = winreg.EnumValue
+except ImportError:  # pragma: no cover
+    winreg = None  # type: ignore[assignment]
+    HKLM = None
+    KEY_READ = 0
+    KEY_QUERY_VALUE = 0
+    KEY_WOW64_32KEY = 0
+    KEY_WOW64_64KEY = 0
+    REG_SZ = 1
+    OpenKey = QueryInfoKey = QueryValueEx = EnumKey = EnumValue = None  # type: ignore[assignment]
+
+HAS_WINREG: Final[bool] = winreg is not None
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
 import os
 import subprocess
+import sys
 import threading
 from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TYPE_CHECKING, Union
 
@@ -23,26 +25,42 @@ class CheckStatus(str, Enum):
     NA = "N/A"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ActionRecommendation:
-    """High-level suggestion returned by probes."""
+    """High-level suggestion returned by probes.
+
+    Frozen so static recommendations can be hoisted to module level and
+    shared across repeated scans instead of reallocated per failure branch.
+    """
 
     id: str
     description: str
-    commands: List[str] = field(default_factory=list)
+    commands: Sequence[str] = ()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CheckResult:
-    """Structured output for each probe."""
+    """Structured output for each probe.
+
+    Frozen with tuple defaults so cached results (ctx.cache, disk cache)
+    can be returned as-is instead of defensively copied.
+    """
 
     id: str
     phase: int
     status: CheckStatus
     summary: str
     details: str
-    evidence: List[str] = field(default_factory=list)
-    actions: List[ActionRecommendation] = field(default_factory=list)
+    evidence: Sequence[str] = ()
+    actions: Sequence[ActionRecommendation] = ()
+    # "verified"/"unverified" when the probe could (not) confirm compliance;
+    # None means the probe does not track verification.
+    verification: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        # Check ids are compared and dict-keyed all over the reporting
+        # layer; interning makes those equality checks pointer compares.
+        object.__setattr__(self, "id", sys.intern(self.id))
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -61,10 +79,13 @@ class CheckResult:
 
 @dataclass
 class CommandResult:
-    """Wrapper around subprocess output used as evidence."""
+    """Wrapper around subprocess output used as evidence.
+
+    ``stdout`` is ``bytes`` when the command ran with ``binary=True``.
+    """
 
     command: Union[str, Sequence[str]]
-    stdout: str
+    stdout: Union[str, bytes]
     stderr: str
     returncode: int
 
@@ -90,10 +111,32 @@ class ProbeContext:
         self.timeout = timeout
         self.workdir = workdir or os.getcwd()
         self.cache: dict[str, Any] = {}
+        self.cache_lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._cmd_cache: dict[tuple, CommandResult] = {}
         self.profile = profile
         self.phase_modes = phase_modes or {}
         self.manifest = manifest
 
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Shared pool for I/O-bound probe work; created on first use."""
+
+        if self._pool is None:
+            with self.cache_lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="uecfg-probe")
+        return self._pool
+
+    def run_command_async(
+        self,
+        command: Union[str, Sequence[str]],
+        **kwargs: Any,
+    ) -> "Future[CommandResult]":
+        """Submit :meth:`run_command` to the shared executor, returning a future."""
+
+        return self.executor.submit(self.run_command, command, **kwargs)
+
     def run_command(
         self,
         command: Union[str, Sequence[str]],
@@ -101,8 +144,26 @@ class ProbeContext:
         check: bool = False,
         timeout: Optional[int] = None,
         env: Optional[dict[str, str]] = None,
+        discard_stderr: bool = False,
+        binary: bool = False,
+        cache: bool = False,
     ) -> CommandResult:
-        """Execute a command with a timeout, capturing output."""
+        """Execute a command with a timeout, capturing output.
+
+        Probes that never inspect stderr can pass ``discard_stderr=True`` to
+        skip the pipe entirely. On Windows every spawn also suppresses the
+        console window, avoiding the conhost attachment cost. ``binary=True``
+        returns stdout as raw bytes, skipping the text decode for callers
+        that feed the buffer straight to a parser. ``cache=True`` memoizes
+        the result for the session; strictly opt-in so only idempotent
+        introspection commands (vswhere, dotnet, git --version) use it.
+        """
+
+        if cache:
+            key = (command if isinstance(command, str) else tuple(command), binary)
+            cached = self._cmd_cache.get(key)
+            if cached is not None:
+                return cached
 
         effective_timeout = timeout or self.timeout
 
@@ -117,12 +178,14 @@ class ProbeContext:
             proc = subprocess.run(
                 cmd,
                 shell=shell,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL if discard_stderr else subprocess.PIPE,
                 timeout=effective_timeout,
-                text=True,
+                text=not binary,
                 check=check,
                 env=env,
                 cwd=self.workdir,
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0) if os.name == "nt" else 0,
             )
         except subprocess.TimeoutExpired as exc:
             return CommandResult(command, exc.stdout or "", exc.stderr or "timeout", returncode=-1)
@@ -131,7 +194,15 @@ class ProbeContext:
         except subprocess.CalledProcessError as exc:
             return CommandResult(command, exc.stdout, exc.stderr, returncode=exc.returncode)
 
-        return CommandResult(command, proc.stdout, proc.stderr, returncode=proc.returncode)
+        stderr = proc.stderr or ""
+        if isinstance(stderr, bytes):
+            stderr = stderr.decode("utf-8", "replace")
+        result = CommandResult(command, proc.stdout, stderr, returncode=proc.returncode)
+        if cache:
+            # Only completed runs are memoized; transient spawn failures
+            # (missing tool, timeout) stay uncached so retries can recover.
+            self._cmd_cache[key] = result
+        return result
 
 
 def score_checks(checks: Iterable[CheckResult]) -> Tuple[float, int]:
@@ -169,8 +240,8 @@ def run_parallel(functions: Sequence[Callable[[], CheckResult]]) -> List[CheckRe
                 status=CheckStatus.FAIL,
                 summary="Probe crashed",
                 details=str(exc),
-                evidence=[],
-                actions=[],
+                evidence=(),
+                actions=(),
             )
 
     threads = [threading.Thread(target=_runner, args=(idx, func)) for idx, func in enumerate(functions)]
@@ -20,8 +20,15 @@ PHASE_MAP = {
     3: ("Phase 3 — Horde / UBA (optional)", horde.PHASE3_PROBES),
 }
 
+# Phases whose probes are independent and I/O-bound run through a dedicated
+# concurrent entry point instead of the sequential loop.
+PHASE_RUNNERS = {
+    1: toolchain.run_phase1,
+    2: unreal.run_phase2,
+}
+
 
-@dataclass
+@dataclass(slots=True)
 class ScanData:
     metadata: Dict[str, str]
     results: Dict[int, List[CheckResult]]
@@ -59,14 +66,18 @@ def run_scan(phases: Sequence[int], ctx: ProbeContext, profile: Profile) -> Scan
                     status=CheckStatus.NA,
                     summary=f"Phase {phase} not applicable for {profile.value} profile",
                     details="",
-                    evidence=[],
-                    actions=[],
+                    evidence=(),
+                    actions=(),
                 )
             )
             results[phase] = bucket
             continue
-        for probe in probes:
-            bucket.append(probe(ctx))
+        phase_runner = PHASE_RUNNERS.get(phase)
+        if phase_runner is not None:
+            bucket.extend(phase_runner(ctx))
+        else:
+            for probe in probes:
+                bucket.append(probe(ctx))
         results[phase] = bucket
 
     metadata = {
@@ -37,7 +37,7 @@ def check_windows_version(ctx: ProbeContext) -> CheckResult:
         summary=summary,
         details=details,
         evidence=[str(uname)],
-        actions=[],
+        actions=(),
     )
 
 
@@ -2,23 +2,99 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+import functools
+import io
+from itertools import zip_longest
 import json
 import os
 from pathlib import Path
-from typing import List, Optional, Sequence, Tuple
+import shutil
+import tempfile
+import time
+from typing import Any, FrozenSet, List, Optional, Sequence, Tuple
 
-try:  # pragma: no cover - not available on non-Windows CI
-    import winreg  # type: ignore
+try:  # pragma: no cover - optional speedup for large vswhere payloads
+    from orjson import loads as _json_loads  # type: ignore
 except ImportError:  # pragma: no cover
-    winreg = None
+    _json_loads = json.loads
 
+try:  # pragma: no cover - optional streaming parser for huge payloads
+    import ijson  # type: ignore
+except ImportError:  # pragma: no cover
+    ijson = None
+
+from ._winreg import (
+    HAS_WINREG,
+    HKLM,
+    KEY_READ,
+    KEY_WOW64_32KEY,
+    KEY_WOW64_64KEY,
+    EnumKey,
+    EnumValue,
+    OpenKey,
+    QueryInfoKey,
+)
 from .base import ActionRecommendation, CheckResult, CheckStatus, ProbeContext
 from ue_configurator.manifest import Manifest
 from ue_configurator.manifest.manifest_types import ToolRequirement
 
 
-@dataclass
+# Static recommendations shared across scans; ActionRecommendation is frozen,
+# so the singletons are safe to return from any number of failure branches.
+_VS_INSTALL_ACTION = ActionRecommendation(
+    id="vs.install",
+    description="Install Visual Studio 2022 with the Unreal Engine recommended workloads",
+    commands=[
+        "vs_installer.exe modify --installPath <path> --add Microsoft.VisualStudio.Component.VC.Tools.x86.x64",
+    ],
+)
+_VS_MODIFY_ACTION = ActionRecommendation(
+    id="vs.modify",
+    description="Add the C++ Desktop workload to Visual Studio",
+    commands=[
+        "vs_installer.exe modify --installPath <path> --add Microsoft.VisualStudio.Workload.NativeDesktop",
+    ],
+)
+_SDK_INSTALL_ACTION = ActionRecommendation(
+    id="sdk.install",
+    description="Install the Windows 10/11 SDK via Visual Studio Installer",
+    commands=[
+        "vs_installer.exe modify --add Microsoft.VisualStudio.Component.Windows10SDK.20348",
+    ],
+)
+_DEBUG_TOOLS_ACTION = ActionRecommendation(
+    id="sdk.debugging-tools",
+    description="Install Debugging Tools for Windows and re-run phase 1 scan.",
+    commands=["uecfg scan --phase 1 --ue-version 5.7 --no-color"],
+)
+_DOTNET_INSTALL_ACTION = ActionRecommendation(
+    id="dotnet.install",
+    description="Install the .NET SDK 6.0+",
+    commands=["winget install --id Microsoft.DotNet.SDK.8 --source winget"],
+)
+_AUTOFIX_ACTION = ActionRecommendation(
+    id="toolchain.autofix",
+    description="Auto-install missing build tools via uecfg fix --phase 1 (requires winget + admin).",
+    commands=[
+        "uecfg fix --phase 1 --dry-run",
+        "uecfg fix --phase 1 --apply",
+    ],
+)
+_CMAKE_INSTALL_ACTION = ActionRecommendation(
+    id="cmake.install",
+    description="Install CMake to benefit from Unreal's CMake exporters",
+    commands=["winget install --id Kitware.CMake --source winget"],
+)
+_NINJA_INSTALL_ACTION = ActionRecommendation(
+    id="ninja.install",
+    description="Install Ninja for faster C++ iteration",
+    commands=["winget install --id Ninja-build.Ninja --source winget"],
+)
+
+
+@dataclass(slots=True)
 class SectionEvaluation:
     status: CheckStatus
     message: str
@@ -26,17 +102,19 @@ class SectionEvaluation:
     actions: List[ActionRecommendation]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VSInstance:
     display_name: str
     installation_path: Path
     version: str
     product_id: str
-    packages: List[str]
+    packages: FrozenSet[str]
 
 
 def _vswhere_candidates() -> Sequence[str]:
-    candidates = ["vswhere"]
+    # Installer locations first: that is where Microsoft ships vswhere.exe,
+    # and probing them is a cheap stat versus a PATH search.
+    candidates = []
     pf86 = os.environ.get("ProgramFiles(x86)")
     if pf86:
         candidates.append(str(Path(pf86) / "Microsoft Visual Studio" / "Installer" / "vswhere.exe"))
@@ -46,36 +124,226 @@ def _vswhere_candidates() -> Sequence[str]:
     return candidates
 
 
+@functools.lru_cache(maxsize=64)
+def _which(name: str) -> Optional[str]:
+    """PATH lookup without spawning a process; cached per tool name."""
+
+    return shutil.which(name)
+
+
+@functools.cache
+def _resolve_vswhere() -> Optional[str]:
+    """Resolve vswhere.exe to an absolute path once per process."""
+
+    for candidate in _vswhere_candidates():
+        if os.path.isfile(candidate):
+            return candidate
+    return shutil.which("vswhere")
+
+
+_DISK_CACHE_TTL = 24 * 60 * 60
+
+
+def _disk_cache_path() -> Optional[Path]:
+    base = os.environ.get("LOCALAPPDATA")
+    if not base:
+        return None
+    return Path(base) / "uecfg" / "vswhere-cache.json"
+
+
+def _disk_cache_load() -> dict:
+    path = _disk_cache_path()
+    if path is None:
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _disk_cache_get(section: str, key: str) -> Optional[Any]:
+    entry = _disk_cache_load().get(section)
+    if not isinstance(entry, dict) or entry.get("key") != key:
+        return None
+    try:
+        age = time.time() - float(entry.get("timestamp", 0))
+    except (TypeError, ValueError):
+        return None
+    if age > _DISK_CACHE_TTL:
+        return None
+    return entry.get("payload")
+
+
+def _disk_cache_put(section: str, key: str, payload: Any) -> None:
+    path = _disk_cache_path()
+    if path is None:
+        return
+    data = _disk_cache_load()
+    data[section] = {"key": key, "timestamp": time.time(), "payload": payload}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(data, handle)
+        os.replace(tmp_name, path)
+    except OSError:
+        return
+
+
+def _vswhere_stat_key() -> Optional[str]:
+    """Cache key tied to the vswhere binary so reinstalls invalidate entries."""
+
+    path = _resolve_vswhere()
+    if path is None:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return f"{path}|{st.st_mtime_ns}|{st.st_size}"
+
+
 def _discover_vs_instances(ctx: ProbeContext) -> List[VSInstance]:
     if "vs_instances" in ctx.cache:
         return ctx.cache["vs_instances"]
 
+    with ctx.cache_lock:
+        return _discover_vs_instances_locked(ctx)
+
+
+def _vs_instance_from_mapping(inst: Any) -> VSInstance:
+    path = Path(inst.get("installationPath", ""))
+    return VSInstance(
+        display_name=inst.get("displayName", path.name),
+        installation_path=path,
+        version=inst.get("installationVersion", "unknown"),
+        product_id=inst.get("productId", "unknown"),
+        packages=frozenset(pkg["id"] for pkg in inst.get("packages", ()) if pkg.get("id")),
+    )
+
+
+def _iter_vswhere_payload(stdout: "str | bytes"):
+    """Yield instance mappings from vswhere output.
+
+    Streams with ijson when available so huge payloads (multiple VS installs,
+    hundreds of package ids each) never sit fully materialized in memory;
+    otherwise falls back to a one-shot parse. Accepts raw bytes so the
+    subprocess output never needs an intermediate str decode.
+    """
+
+    if ijson is not None:
+        data = stdout if isinstance(stdout, bytes) else stdout.encode("utf-8")
+        try:
+            yield from ijson.items(io.BytesIO(data), "item")
+        except Exception:  # pragma: no cover - malformed payload
+            pass
+        return
+    try:
+        parsed = _json_loads(stdout)
+    except ValueError:
+        return
+    yield from parsed
+
+
+def _vs_instances_root() -> str:
+    program_data = os.environ.get("ProgramData", r"C:\ProgramData")
+    return os.path.join(program_data, "Microsoft", "VisualStudio", "Packages", "_Instances")
+
+
+def _discover_vs_instances_direct() -> Optional[List[VSInstance]]:
+    """Read the VS installer's per-instance state.json files directly.
+
+    The installer keeps everything vswhere would report under
+    %ProgramData%\\Microsoft\\VisualStudio\\Packages\\_Instances, so reading
+    those files skips the vswhere process spawn entirely. Returns None when
+    the directory is missing or any state file fails to parse, in which case
+    the caller falls back to vswhere.
+    """
+
+    try:
+        with os.scandir(_vs_instances_root()) as it:
+            instance_dirs = [entry.path for entry in it if entry.is_dir(follow_symlinks=False)]
+    except OSError:
+        return None
     instances: List[VSInstance] = []
-    for candidate in _vswhere_candidates():
-        cmd = [candidate, "-all", "-format", "json", "-prerelease", "-products", "*"]
-        result = ctx.run_command(cmd, timeout=15)
-        if result.returncode != 0 or not result.stdout.strip():
-            continue
+    for instance_dir in instance_dirs:
         try:
-            parsed = json.loads(result.stdout)
-        except json.JSONDecodeError:
-            continue
-        for inst in parsed:
-            path = Path(inst.get("installationPath", ""))
-            display = inst.get("displayName", path.name)
-            packages = [pkg.get("id", "") for pkg in inst.get("packages", []) if pkg.get("id")]
-            instances.append(
+            with open(os.path.join(instance_dir, "state.json"), "rb") as handle:
+                state = _json_loads(handle.read())
+        except (OSError, ValueError):
+            return None
+        path = Path(state.get("installationPath", ""))
+        instances.append(
+            VSInstance(
+                display_name=state.get("displayName", path.name),
+                installation_path=path,
+                version=state.get("installationVersion", "unknown"),
+                product_id=state.get("productId", "unknown"),
+                packages=frozenset(
+                    pkg["id"] for pkg in state.get("selectedPackages", ()) if pkg.get("id")
+                ),
+            )
+        )
+    return instances or None
+
+
+def _discover_vs_instances_locked(ctx: ProbeContext) -> List[VSInstance]:
+    if "vs_instances" in ctx.cache:
+        return ctx.cache["vs_instances"]
+
+    stat_key = _vswhere_stat_key()
+    if stat_key is not None:
+        cached = _disk_cache_get("vs_instances", stat_key)
+        if cached is not None:
+            instances = [
                 VSInstance(
-                    display_name=display,
-                    installation_path=path,
-                    version=inst.get("installationVersion", "unknown"),
-                    product_id=inst.get("productId", "unknown"),
-                    packages=packages,
+                    display_name=item.get("display_name", ""),
+                    installation_path=Path(item.get("installation_path", "")),
+                    version=item.get("version", "unknown"),
+                    product_id=item.get("product_id", "unknown"),
+                    packages=frozenset(item.get("packages", ())),
                 )
+                for item in cached
+            ]
+            ctx.cache["vs_instances"] = instances
+            return instances
+
+    direct = _discover_vs_instances_direct()
+    if direct is not None:
+        ctx.cache["vs_instances"] = direct
+        return direct
+
+    instances: List[VSInstance] = []
+    vswhere_path = _resolve_vswhere()
+    if vswhere_path is not None:
+        cmd = [vswhere_path, "-all", "-format", "json", "-prerelease", "-utf8", "-nologo", "-products", "*"]
+        # vswhere is local and cheap; a tight timeout keeps a wedged
+        # installer service from stalling the whole phase.
+        result = ctx.run_command(cmd, timeout=5, discard_stderr=True, binary=True, cache=True)
+        if result.returncode == 0 and result.stdout.strip():
+            instances.extend(
+                _vs_instance_from_mapping(inst) for inst in _iter_vswhere_payload(result.stdout)
             )
-        if instances:
-            break
 
+    # Never persist an empty discovery: a retry after installing VS must
+    # rediscover instead of serving a stale "not found" for the TTL window.
+    if instances and stat_key is not None:
+        _disk_cache_put(
+            "vs_instances",
+            stat_key,
+            [
+                {
+                    "display_name": inst.display_name,
+                    "installation_path": str(inst.installation_path),
+                    "version": inst.version,
+                    "product_id": inst.product_id,
+                    "packages": sorted(inst.packages),
+                }
+                for inst in instances
+            ],
+        )
     ctx.cache["vs_instances"] = instances
     return instances
 
@@ -85,6 +353,7 @@ def get_vs_instances(ctx: ProbeContext) -> List[VSInstance]:
     return _discover_vs_instances(ctx)
 
 
+@functools.lru_cache(maxsize=256)
 def parse_vs_version(raw: str) -> Tuple[int, ...]:
     parts: List[int] = []
     for token in raw.split("."):
@@ -99,36 +368,68 @@ def parse_vs_version(raw: str) -> Tuple[int, ...]:
 
 
 def compare_versions(left: Tuple[int, ...], right: Tuple[int, ...]) -> int:
-    max_len = max(len(left), len(right))
-    padded_left = left + (0,) * (max_len - len(left))
-    padded_right = right + (0,) * (max_len - len(right))
-    if padded_left < padded_right:
-        return -1
-    if padded_left > padded_right:
-        return 1
+    for a, b in zip_longest(left, right, fillvalue=0):
+        if a != b:
+            return -1 if a < b else 1
     return 0
 
 
 def _collect_windows_sdks(ctx: ProbeContext) -> List[Tuple[str, str]]:
+    cached = ctx.cache.get("windows_sdk_entries")
+    if cached is not None:
+        return cached
+    with ctx.cache_lock:
+        return _collect_windows_sdks_locked(ctx)
+
+
+def _collect_windows_sdks_locked(ctx: ProbeContext) -> List[Tuple[str, str]]:
     cached = ctx.cache.get("windows_sdk_entries")
     if cached is not None:
         return cached
     entries: List[Tuple[str, str]] = []
-    if winreg is None:
+    if not HAS_WINREG:
         ctx.cache["windows_sdk_entries"] = entries
         return entries
-    for view in (0, getattr(winreg, "KEY_WOW64_32KEY", 0)):
+    disk_cached = _disk_cache_get("windows_sdks", "v10.0")
+    if disk_cached is not None:
+        entries = [(str(version), str(path)) for version, path in disk_cached]
+        ctx.cache["windows_sdk_entries"] = entries
+        return entries
+    # Explicit 64-bit view first so one open finds the primary hive; the
+    # 32-bit view still covers SDKs registered by 32-bit installers.
+    for view in (KEY_WOW64_64KEY, KEY_WOW64_32KEY):
         try:
-            with winreg.OpenKey(
-                winreg.HKEY_LOCAL_MACHINE,
-                r"SOFTWARE\Microsoft\Microsoft SDKs\Windows\v10.0",
-                access=winreg.KEY_READ | view,
-            ) as key:
-                installation_folder, _ = winreg.QueryValueEx(key, "InstallationFolder")
-                product_version, _ = winreg.QueryValueEx(key, "ProductVersion")
-                entries.append((str(product_version), str(installation_folder)))
+            base = OpenKey(
+                HKLM,
+                r"SOFTWARE\Microsoft\Microsoft SDKs\Windows",
+                access=KEY_READ | view,
+            )
         except FileNotFoundError:
             continue
+        with base:
+            subkey_count = QueryInfoKey(base)[0]
+            for index in range(subkey_count):
+                name = EnumKey(base, index)
+                if not name.startswith("v"):
+                    continue
+                try:
+                    with OpenKey(base, name) as key:
+                        # Enumerate every value in one open-handle loop rather
+                        # than a kernel round-trip per QueryValueEx.
+                        values: dict[str, Any] = {}
+                        for i in range(QueryInfoKey(key)[1]):
+                            value_name, value, _ = EnumValue(key, i)
+                            values[value_name] = value
+                except FileNotFoundError:
+                    continue
+                installation_folder = values.get("InstallationFolder")
+                product_version = values.get("ProductVersion")
+                if installation_folder and product_version:
+                    entry = (str(product_version), str(installation_folder))
+                    if entry not in entries:
+                        entries.append(entry)
+    if entries:
+        _disk_cache_put("windows_sdks", "v10.0", entries)
     ctx.cache["windows_sdk_entries"] = entries
     return entries
 
@@ -136,15 +437,7 @@ def _collect_windows_sdks(ctx: ProbeContext) -> List[Tuple[str, str]]:
 def check_visual_studio(ctx: ProbeContext) -> CheckResult:
     instances = _discover_vs_instances(ctx)
     if not instances:
-        actions = [
-            ActionRecommendation(
-                id="vs.install",
-                description="Install Visual Studio 2022 with the Unreal Engine recommended workloads",
-                commands=[
-                    "vs_installer.exe modify --installPath <path> --add Microsoft.VisualStudio.Component.VC.Tools.x86.x64",
-                ],
-            )
-        ]
+        actions = [_VS_INSTALL_ACTION]
         return CheckResult(
             id="toolchain.vs",
             phase=1,
@@ -153,6 +446,7 @@ def check_visual_studio(ctx: ProbeContext) -> CheckResult:
             details="vswhere could not find any installed Visual Studio instances.",
             evidence=["vswhere"],
             actions=actions,
+            verification="verified",
         )
 
     evidence = [f"{inst.display_name} ({inst.version}) @ {inst.installation_path}" for inst in instances]
@@ -163,7 +457,8 @@ def check_visual_studio(ctx: ProbeContext) -> CheckResult:
         summary=f"{len(instances)} Visual Studio instance(s) detected",
         details="; ".join(evidence),
         evidence=evidence,
-        actions=[],
+        actions=(),
+        verification="verified",
     )
 
 
@@ -174,23 +469,21 @@ def check_msvc_toolchain(ctx: ProbeContext) -> CheckResult:
         msvc_root = inst.installation_path / "VC" / "Tools" / "MSVC"
         if not msvc_root.is_dir():
             continue
-        for child in sorted(msvc_root.iterdir()):
-            if child.is_dir():
-                bin_path = child / "bin" / "Hostx64" / "x64"
-                if bin_path.exists():
-                    msvc_paths.append(str(bin_path))
+        with os.scandir(msvc_root) as it:
+            toolset_dirs = [(entry.name, entry.path) for entry in it if entry.is_dir(follow_symlinks=False)]
+        # Newest toolset first by numeric version; a lexicographic sort would
+        # misorder 14.9.* after 14.10.*. Only the newest usable toolset
+        # matters, so stop at the first bin directory that exists.
+        toolset_dirs.sort(key=lambda item: parse_vs_version(item[0]), reverse=True)
+        for _, toolset_path in toolset_dirs:
+            bin_path = os.path.join(toolset_path, "bin", "Hostx64", "x64")
+            if os.path.isdir(bin_path):
+                msvc_paths.append(bin_path)
+                break
     status = CheckStatus.PASS if msvc_paths else CheckStatus.FAIL
     actions = []
     if not msvc_paths:
-        actions.append(
-            ActionRecommendation(
-                id="vs.modify",
-                description="Add the C++ Desktop workload to Visual Studio",
-                commands=[
-                    "vs_installer.exe modify --installPath <path> --add Microsoft.VisualStudio.Workload.NativeDesktop",
-                ],
-            )
-        )
+        actions.append(_VS_MODIFY_ACTION)
     return CheckResult(
         id="toolchain.msvc",
         phase=1,
@@ -203,15 +496,18 @@ def check_msvc_toolchain(ctx: ProbeContext) -> CheckResult:
 
 
 def check_windows_sdks(ctx: ProbeContext) -> CheckResult:
-    if winreg is None:  # pragma: no cover - non-Windows
+    cached = ctx.cache.get("sdk_result")
+    if cached is not None:
+        return cached
+    if not HAS_WINREG:  # pragma: no cover - non-Windows
         return CheckResult(
             id="toolchain.sdk",
             phase=1,
             status=CheckStatus.WARN,
             summary="winreg unavailable",
             details="Cannot inspect Windows SDK registry hive from this environment.",
-            evidence=[],
-            actions=[],
+            evidence=(),
+            actions=(),
         )
 
     entries = _collect_windows_sdks(ctx)
@@ -219,16 +515,8 @@ def check_windows_sdks(ctx: ProbeContext) -> CheckResult:
     status = CheckStatus.PASS if entries else CheckStatus.FAIL
     actions = []
     if not sdk_keys:
-        actions.append(
-            ActionRecommendation(
-                id="sdk.install",
-                description="Install the Windows 10/11 SDK via Visual Studio Installer",
-                commands=[
-                    "vs_installer.exe modify --add Microsoft.VisualStudio.Component.Windows10SDK.20348",
-                ],
-            )
-        )
-    return CheckResult(
+        actions.append(_SDK_INSTALL_ACTION)
+    result = CheckResult(
         id="toolchain.sdk",
         phase=1,
         status=status,
@@ -237,6 +525,8 @@ def check_windows_sdks(ctx: ProbeContext) -> CheckResult:
         evidence=sdk_keys or ["missing"],
         actions=actions,
     )
+    ctx.cache["sdk_result"] = result
+    return result
 
 
 def _pdbcopy_candidates() -> List[Path]:
@@ -271,7 +561,7 @@ def check_pdbcopy(ctx: ProbeContext) -> CheckResult:
             summary="pdbcopy.exe detected",
             details=f"Using {unique_hits[0]}",
             evidence=unique_hits,
-            actions=[],
+            actions=(),
         )
 
     return CheckResult(
@@ -284,34 +574,72 @@ def check_pdbcopy(ctx: ProbeContext) -> CheckResult:
             "BuildGraph Installed Build can strip symbols."
         ),
         evidence=["missing"],
-        actions=[
-            ActionRecommendation(
-                id="sdk.debugging-tools",
-                description="Install Debugging Tools for Windows and re-run phase 1 scan.",
-                commands=["uecfg scan --phase 1 --ue-version 5.7 --no-color"],
-            )
-        ],
+        actions=[_DEBUG_TOOLS_ACTION],
     )
 
 
+def _parse_dotnet_info(text: str) -> Tuple[List[str], List[str]]:
+    """Split `dotnet --info` output into SDK and runtime entry lines."""
+
+    sdk_lines: List[str] = []
+    runtime_lines: List[str] = []
+    target: Optional[List[str]] = None
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped == ".NET SDKs installed:":
+            target = sdk_lines
+            continue
+        if stripped == ".NET runtimes installed:":
+            target = runtime_lines
+            continue
+        if not line[:1].isspace():
+            target = None
+            continue
+        if target is not None:
+            target.append(stripped)
+    return sdk_lines, runtime_lines
+
+
 def check_dotnet(ctx: ProbeContext) -> CheckResult:
-    sdk_result = ctx.run_command(["dotnet", "--list-sdks"], timeout=10)
-    runtime_result = ctx.run_command(["dotnet", "--list-runtimes"], timeout=10)
-    sdk_lines = [line.strip() for line in sdk_result.stdout.splitlines() if line.strip()]
-    runtime_lines = [line.strip() for line in runtime_result.stdout.splitlines() if line.strip()]
+    if _which("dotnet") is None:
+        # Skip the process spawn entirely when the host is not on PATH.
+        ctx.cache["dotnet.sdks"] = []
+        ctx.cache["dotnet.runtimes"] = []
+        return CheckResult(
+            id="toolchain.dotnet",
+            phase=1,
+            status=CheckStatus.WARN,
+            summary="dotnet SDK missing",
+            details="dotnet command missing or returned no SDKs.",
+            evidence=(),
+            actions=[_DOTNET_INSTALL_ACTION],
+        )
+
+    # One `dotnet --info` carries both SDK and runtime listings, paying the
+    # .NET host startup cost once instead of twice.
+    info_result = ctx.run_command(["dotnet", "--info"], timeout=15, discard_stderr=True, cache=True)
+    ok_rc = info_result.returncode == 0
+    sdk_lines, runtime_lines = _parse_dotnet_info(info_result.stdout) if ok_rc else ([], [])
+    if not sdk_lines:
+        # Old hosts omit the SDK section from --info; fall back to the two
+        # list commands, overlapped to hide the duplicated startup cost.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            sdk_future = pool.submit(ctx.run_command, ["dotnet", "--list-sdks"], timeout=10, discard_stderr=True)
+            runtime_future = pool.submit(ctx.run_command, ["dotnet", "--list-runtimes"], timeout=10, discard_stderr=True)
+        sdk_result = sdk_future.result()
+        runtime_result = runtime_future.result()
+        sdk_lines = [line.strip() for line in sdk_result.stdout.splitlines() if line.strip()]
+        runtime_lines = [line.strip() for line in runtime_result.stdout.splitlines() if line.strip()]
+        ok_rc = sdk_result.returncode == 0
     ctx.cache["dotnet.sdks"] = sdk_lines
     ctx.cache["dotnet.runtimes"] = runtime_lines
-    ok = sdk_result.returncode == 0 and bool(sdk_lines)
+    ok = ok_rc and bool(sdk_lines)
     status = CheckStatus.PASS if ok else CheckStatus.WARN
     actions = []
     if not ok:
-        actions.append(
-            ActionRecommendation(
-                id="dotnet.install",
-                description="Install the .NET SDK 6.0+",
-                commands=["winget install --id Microsoft.DotNet.SDK.8 --source winget"],
-            )
-        )
+        actions.append(_DOTNET_INSTALL_ACTION)
     details = (
         f"SDKs: {', '.join(sdk_lines[:3])}"
         if ok
@@ -329,47 +657,83 @@ def check_dotnet(ctx: ProbeContext) -> CheckResult:
     )
 
 
-def _detect_tool(tool: str, ctx: ProbeContext) -> List[str]:
-    """Find tool via PATH and common winget install locations."""
-    cache_key = f"where::{tool.lower()}"
-    cached = ctx.cache.get(cache_key)
-    if cached is not None:
-        return cached
-
-    paths: List[str] = []
+_WINGET_ROOTS = [
+    "C:\\Program Files\\CMake\\bin",
+    "C:\\Program Files (x86)\\CMake\\bin",
+    "C:\\ProgramData\\chocolatey\\bin",
+]
 
-    # Primary: PATH lookup
-    result = ctx.run_command(["where", tool], timeout=5)
-    if result.returncode == 0:
-        paths.extend([line.strip() for line in result.stdout.splitlines() if line.strip()])
 
-    # Secondary: common install roots (winget/choco), in case PATH is stale
+def _detect_tools(tools: Sequence[str], ctx: ProbeContext) -> dict[str, List[str]]:
+    """Find several tools via PATH and common winget install locations in one pass."""
+    found: dict[str, List[str]] = {}
+    pending: List[str] = []
+    for tool in tools:
+        cache_key = f"where::{tool.lower()}"
+        cached = ctx.cache.get(cache_key)
+        if cached is not None:
+            found[tool] = cached
+            continue
+        disk_cached = _disk_cache_get(cache_key, tool.lower())
+        if disk_cached is not None:
+            paths = [str(p) for p in disk_cached]
+            ctx.cache[cache_key] = paths
+            found[tool] = paths
+            continue
+        pending.append(tool)
+    if not pending:
+        return found
+
+    paths_by_tool: dict[str, List[str]] = {tool: [] for tool in pending}
+    sought = {tool.lower(): tool for tool in pending}
+
+    # Primary: in-process PATH + PATHEXT resolution; same answer as
+    # where.exe without paying a CreateProcess per lookup.
+    for tool in pending:
+        hit = _which(tool)
+        if hit:
+            paths_by_tool[tool].append(hit)
+
+    # Secondary: common install roots (winget/choco), in case PATH is stale.
+    # One scandir per root reads the dirent block once instead of stat-ing
+    # each (root, tool) combination.
     if not ctx.dry_run:
-        winget_roots = [
-            "C:\\Program Files\\CMake\\bin",
-            "C:\\Program Files (x86)\\CMake\\bin",
-            "C:\\ProgramData\\chocolatey\\bin",
-        ]
-        for root in winget_roots:
-            candidate = Path(root) / tool
-            if candidate.exists():
-                paths.append(str(candidate))
+        for root in _WINGET_ROOTS:
+            try:
+                with os.scandir(root) as it:
+                    names = {entry.name.lower(): entry.path for entry in it}
+            except OSError:
+                continue
+            for lower, tool in sought.items():
+                candidate = names.get(lower)
+                if candidate is not None:
+                    paths_by_tool[tool].append(candidate)
+
+    for tool, paths in paths_by_tool.items():
+        # Deduplicate preserving order
+        seen: set[str] = set()
+        unique_paths: List[str] = []
+        for p in paths:
+            if p not in seen:
+                seen.add(p)
+                unique_paths.append(p)
+        cache_key = f"where::{tool.lower()}"
+        if unique_paths:
+            _disk_cache_put(cache_key, tool.lower(), unique_paths)
+        ctx.cache[cache_key] = unique_paths
+        found[tool] = unique_paths
+    return found
 
-    # Deduplicate preserving order
-    seen: set[str] = set()
-    unique_paths: List[str] = []
-    for p in paths:
-        if p not in seen:
-            seen.add(p)
-            unique_paths.append(p)
 
-    ctx.cache[cache_key] = unique_paths
-    return unique_paths
+def _detect_tool(tool: str, ctx: ProbeContext) -> List[str]:
+    """Find tool via PATH and common winget install locations."""
+    return _detect_tools((tool,), ctx)[tool]
 
 
 def check_cmake_ninja(ctx: ProbeContext) -> CheckResult:
-    cmake_paths = _detect_tool("cmake.exe", ctx)
-    ninja_paths = _detect_tool("ninja.exe", ctx)
+    detected = _detect_tools(("cmake.exe", "ninja.exe"), ctx)
+    cmake_paths = detected["cmake.exe"]
+    ninja_paths = detected["ninja.exe"]
     missing = []
     if not cmake_paths:
         missing.append("CMake (not on PATH; checked where.exe and common install locations)")
@@ -378,32 +742,11 @@ def check_cmake_ninja(ctx: ProbeContext) -> CheckResult:
     status = CheckStatus.PASS if not missing else CheckStatus.WARN
     actions = []
     if missing and _winget_available(ctx):
-        actions.append(
-            ActionRecommendation(
-                id="toolchain.autofix",
-                description="Auto-install missing build tools via uecfg fix --phase 1 (requires winget + admin).",
-                commands=[
-                    "uecfg fix --phase 1 --dry-run",
-                    "uecfg fix --phase 1 --apply",
-                ],
-            )
-        )
+        actions.append(_AUTOFIX_ACTION)
     if not cmake_paths:
-        actions.append(
-            ActionRecommendation(
-                id="cmake.install",
-                description="Install CMake to benefit from Unreal's CMake exporters",
-                commands=["winget install --id Kitware.CMake --source winget"],
-            )
-        )
+        actions.append(_CMAKE_INSTALL_ACTION)
     if not ninja_paths:
-        actions.append(
-            ActionRecommendation(
-                id="ninja.install",
-                description="Install Ninja for faster C++ iteration",
-                commands=["winget install --id Ninja-build.Ninja --source winget"],
-            )
-        )
+        actions.append(_NINJA_INSTALL_ACTION)
     details = []
     if cmake_paths:
         details.append(f"CMake: {cmake_paths[0]}")
@@ -422,17 +765,23 @@ def check_cmake_ninja(ctx: ProbeContext) -> CheckResult:
     )
 
 
-def _vs_component_action(required_components: List[str]) -> ActionRecommendation:
-    command_parts = ["vs_installer.exe", "modify", "--installPath", "<path>"]
-    for comp in required_components:
-        command_parts.extend(["--add", comp])
+@functools.lru_cache(maxsize=64)
+def _vs_component_action_cached(required_components: Tuple[str, ...]) -> ActionRecommendation:
+    command = "vs_installer.exe modify --installPath <path>" + "".join(
+        f" --add {comp}" for comp in required_components
+    )
     return ActionRecommendation(
         id="manifest.vs.components",
         description="Add missing Visual Studio workloads/components for the current manifest.",
-        commands=[" ".join(command_parts)],
+        commands=[command],
     )
 
 
+def _vs_component_action(required_components: List[str]) -> ActionRecommendation:
+    # Identical recommendations across phases share one cached object.
+    return _vs_component_action_cached(tuple(required_components))
+
+
 def _evaluate_visual_studio(manifest: "Manifest", ctx: ProbeContext) -> SectionEvaluation:
     instances = _discover_vs_instances(ctx)
     vs_req = manifest.visual_studio
@@ -451,8 +800,14 @@ def _evaluate_visual_studio(manifest: "Manifest", ctx: ProbeContext) -> SectionE
             continue
         if vs_req.min_version and compare_versions(version_tuple, min_tuple) < 0:
             continue
-        missing = [comp for comp in vs_req.requires_components if comp and comp not in inst.packages]
+        # Discovery hands us a frozenset, but callers may construct instances
+        # with plain lists; normalize so membership tests stay O(1).
+        pkg_set = inst.packages if isinstance(inst.packages, (set, frozenset)) else frozenset(inst.packages)
+        missing = [comp for comp in vs_req.requires_components if comp and comp not in pkg_set]
         candidates.append((inst, version_tuple, missing))
+        if inst.packages and not missing:
+            # Zero missing components cannot be beaten; stop scanning.
+            break
     if not candidates:
         min_label = vs_req.min_version or "n/a"
         return SectionEvaluation(
@@ -461,13 +816,17 @@ def _evaluate_visual_studio(manifest: "Manifest", ctx: ProbeContext) -> SectionE
             evidence=[f"found={len(instances)}; min_version={min_label}"],
             actions=[_vs_component_action(vs_req.requires_components)] if vs_req.requires_components else [],
         )
-    best_inst, best_version, missing = candidates[0]
+    # Single pass: fewest missing components wins, highest version breaks ties.
+    best_inst, best_version, missing = min(
+        candidates, key=lambda entry: (len(entry[2]), tuple(-part for part in entry[1]))
+    )
     if not best_inst.packages:
         artifact_notes: List[str] = []
         artifact_evidence: List[str] = []
         msvc_root = best_inst.installation_path / "VC" / "Tools" / "MSVC"
         if msvc_root.is_dir():
-            versions = sorted([child.name for child in msvc_root.iterdir() if child.is_dir()])
+            with os.scandir(msvc_root) as it:
+                versions = sorted(entry.name for entry in it if entry.is_dir(follow_symlinks=False))
             if versions:
                 artifact_notes.append(f"MSVC toolsets: {', '.join(versions)}")
                 cl_path = msvc_root / versions[0] / "bin" / "Hostx64" / "x64" / "cl.exe"
@@ -497,19 +856,13 @@ def _evaluate_visual_studio(manifest: "Manifest", ctx: ProbeContext) -> SectionE
             evidence=[f"{best_inst.display_name} {best_inst.version} @ {best_inst.installation_path}"] + artifact_evidence,
             actions=[_vs_component_action(vs_req.requires_components)],
         )
-    for inst, version, missing_components in candidates[1:]:
-        if len(missing_components) < len(missing):
-            best_inst, best_version, missing = inst, version, missing_components
-            continue
-        if len(missing_components) == len(missing) and compare_versions(version, best_version) > 0:
-            best_inst, best_version, missing = inst, version, missing_components
     evidence = [f"{best_inst.display_name} {best_inst.version} @ {best_inst.installation_path}"]
     if not missing:
         return SectionEvaluation(
             status=CheckStatus.PASS,
             message=f"Visual Studio {vs_req.required_major}.x build meets manifest requirements.",
             evidence=evidence,
-            actions=[],
+            actions=(),
         )
     action = _vs_component_action(missing)
     return SectionEvaluation(
@@ -522,23 +875,28 @@ def _evaluate_visual_studio(manifest: "Manifest", ctx: ProbeContext) -> SectionE
 
 def _evaluate_msvc(manifest: "Manifest", ctx: ProbeContext) -> SectionEvaluation:
     instances = _discover_vs_instances(ctx)
+    required_family = manifest.msvc.preferred_toolset_family
+    # Scan lazily and bail on the first matching toolset; the full listing is
+    # only needed as evidence on the FAIL path below.
     toolsets: List[Tuple[str, str]] = []
     for inst in instances:
         msvc_root = inst.installation_path / "VC" / "Tools" / "MSVC"
-        if not msvc_root.is_dir():
+        try:
+            it = os.scandir(msvc_root)
+        except OSError:
             continue
-        for child in msvc_root.iterdir():
-            if child.is_dir():
-                toolsets.append((inst.display_name, child.name))
-    required_family = manifest.msvc.preferred_toolset_family
-    match = next((entry for entry in toolsets if entry[1].startswith(required_family)), None)
-    if match:
-        return SectionEvaluation(
-            status=CheckStatus.PASS,
-            message=f"MSVC toolset {required_family} detected.",
-            evidence=[f"{match[0]} -> {match[1]}"],
-            actions=[],
-        )
+        with it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                if entry.name.startswith(required_family):
+                    return SectionEvaluation(
+                        status=CheckStatus.PASS,
+                        message=f"MSVC toolset {required_family} detected.",
+                        evidence=[f"{inst.display_name} -> {entry.name}"],
+                        actions=(),
+                    )
+                toolsets.append((inst.display_name, entry.name))
     evidence = [f"{name} -> {version}" for name, version in toolsets] or ["no toolsets found"]
     action = _vs_component_action([f"MSVC.{required_family}"])
     return SectionEvaluation(
@@ -552,12 +910,12 @@ def _evaluate_msvc(manifest: "Manifest", ctx: ProbeContext) -> SectionEvaluation
 def _evaluate_windows_sdk(manifest: "Manifest", ctx: ProbeContext) -> SectionEvaluation:
     entries = _collect_windows_sdks(ctx)
     if not entries:
-        if winreg is None:
+        if not HAS_WINREG:
             return SectionEvaluation(
                 status=CheckStatus.WARN,
                 message="Unable to inspect Windows SDK registry hive on this platform.",
-                evidence=[],
-                actions=[],
+                evidence=(),
+                actions=(),
             )
         return SectionEvaluation(
             status=CheckStatus.FAIL,
@@ -583,7 +941,7 @@ def _evaluate_windows_sdk(manifest: "Manifest", ctx: ProbeContext) -> SectionEva
             status=CheckStatus.PASS,
             message=f"Windows SDK matches preferred versions ({preferred_list}).",
             evidence=evidence,
-            actions=[],
+            actions=(),
         )
     if minimum:
         min_tuple = parse_vs_version(minimum)
@@ -605,7 +963,7 @@ def _evaluate_windows_sdk(manifest: "Manifest", ctx: ProbeContext) -> SectionEva
         status=CheckStatus.WARN,
         message="Windows SDK installed but not in preferred manifest list.",
         evidence=evidence,
-        actions=[],
+        actions=(),
     )
 
 
@@ -662,7 +1020,12 @@ def _check_single_tool(ctx: ProbeContext, requirement: ToolRequirement) -> Secti
                     message = f".NET SDK {version} below required {requirement.min_version}."
                     actions = _winget_action()
     elif name == "git":
-        result = ctx.run_command(["git", "--version"], timeout=10)
+        if _which("git") is None:
+            status = CheckStatus.FAIL
+            message = "Git command missing."
+            actions = _winget_action()
+            return SectionEvaluation(status=status, message=message, evidence=evidence, actions=actions)
+        result = ctx.run_command(["git", "--version"], timeout=10, discard_stderr=True, cache=True)
         if result.returncode != 0:
             status = CheckStatus.FAIL
             message = "Git command missing."
@@ -692,15 +1055,17 @@ def _evaluate_extras(manifest: "Manifest", ctx: ProbeContext) -> SectionEvaluati
         return SectionEvaluation(
             status=CheckStatus.NA,
             message="No supplemental tool requirements in manifest.",
-            evidence=[],
-            actions=[],
+            evidence=(),
+            actions=(),
         )
     overall_status = CheckStatus.PASS
     messages: List[str] = []
     evidence: List[str] = []
     actions: List[ActionRecommendation] = []
-    for requirement in required:
-        section = _check_single_tool(ctx, requirement)
+    # Each tool check is independent subprocess/PATH I/O; overlap them.
+    with ThreadPoolExecutor(max_workers=min(8, len(required))) as pool:
+        sections = list(pool.map(lambda req: _check_single_tool(ctx, req), required))
+    for section in sections:
         if section.status == CheckStatus.FAIL:
             overall_status = CheckStatus.FAIL
         elif section.status == CheckStatus.WARN and overall_status != CheckStatus.FAIL:
@@ -730,7 +1095,7 @@ def check_manifest_compliance(ctx: ProbeContext) -> CheckResult:
             status=CheckStatus.NA,
             summary="No toolchain manifest selected",
             details="Run with --ue-version (e.g., 5.7) or --manifest to enforce a specific toolchain.",
-            evidence=[],
+            evidence=(),
             actions=[
                 ActionRecommendation(
                     id="manifest.select",
@@ -748,7 +1113,7 @@ def check_manifest_compliance(ctx: ProbeContext) -> CheckResult:
     ]
     status = CheckStatus.PASS
     details: List[str] = []
-    evidence = [f"Manifest {manifest.id} fingerprint {manifest.fingerprint[:12]}"]
+    evidence = [f"Manifest {manifest.id} fingerprint {manifest.short_fingerprint}"]
     actions: List[ActionRecommendation] = []
     for section in sections:
         if section.status == CheckStatus.FAIL:
@@ -759,6 +1124,8 @@ def check_manifest_compliance(ctx: ProbeContext) -> CheckResult:
             details.append(section.message)
         evidence.extend(section.evidence)
         actions.extend(section.actions)
+    # Sections can surface the same recommendation; emit each id once.
+    actions = list({action.id: action for action in actions}.values())
     if status == CheckStatus.PASS:
         summary = f"{manifest.describe()} manifest compliance verified."
     elif status == CheckStatus.WARN:
@@ -796,6 +1163,31 @@ PHASE1_PROBES = [
 ]
 
 
+def prewarm_phase1(ctx: ProbeContext) -> None:
+    """Warm shared Phase 1 discovery caches before the probe fan-out.
+
+    Several probes need the vswhere instance list and SDK registry entries;
+    resolving them once up-front avoids a thundering herd of duplicate
+    subprocess and registry work from concurrent probe threads.
+    """
+
+    _discover_vs_instances(ctx)
+    _collect_windows_sdks(ctx)
+
+
+def run_phase1(ctx: ProbeContext) -> List[CheckResult]:
+    """Run all Phase 1 probes concurrently.
+
+    Each probe blocks on subprocess or registry I/O, so fanning out on the
+    context's shared executor collapses the phase wall time to the slowest
+    probe instead of the sum of all of them.
+    """
+
+    prewarm_phase1(ctx)
+    futures = [ctx.executor.submit(probe, ctx) for probe in PHASE1_PROBES]
+    return [future.result() for future in futures]
+
+
 def _winget_available(ctx: ProbeContext) -> bool:
     cached = ctx.cache.get("winget_available")
     if cached is not None:
@@ -2,25 +2,107 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import io
+import mmap
 import os
 import re
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Dict, List, Tuple, Optional
 
-try:  # pragma: no cover - Windows only
-    import winreg  # type: ignore
-except ImportError:  # pragma: no cover
-    winreg = None
-
+from ._winreg import (
+    HAS_WINREG,
+    HKLM,
+    KEY_QUERY_VALUE,
+    KEY_READ,
+    KEY_WOW64_64KEY,
+    REG_SZ,
+    EnumKey,
+    OpenKey,
+    QueryInfoKey,
+    QueryValueEx,
+)
 from .base import ActionRecommendation, CheckResult, CheckStatus, ProbeContext
+from .toolchain import _disk_cache_get, _disk_cache_put
 from ue_configurator.probe import horde as horde_probe
 from ue_configurator.ue import config_paths
-from ue_configurator.ue.build_config import parse_build_configuration_flags
-from ue_configurator.ue.build_targets import determine_build_plan, missing_targets, summarize_plan
+from ue_configurator.ue.build_targets import (
+    canonical_binaries,
+    determine_build_plan,
+    missing_targets,
+    summarize_plan,
+)
 from ue_configurator.ue.artifact_resolver import ArtifactResolver
 
 
+@functools.lru_cache(maxsize=128)
+def _ue_subpath(root: str, *parts: str) -> Path:
+    """Join engine subpaths once per (root, parts); probes share prefixes."""
+
+    return Path(root).joinpath(*parts)
+
+
+def _dir_snapshot(ctx: ProbeContext, path: Path) -> frozenset[str]:
+    """One directory listing per scan, shared by every probe that stats it."""
+
+    key = ("dir", str(path))
+    snapshot = ctx.cache.get(key)
+    if snapshot is None:
+        try:
+            snapshot = frozenset(os.listdir(path))
+        except OSError:
+            snapshot = frozenset()
+        ctx.cache[key] = snapshot
+    return snapshot
+
+
+def _cached_exists(ctx: ProbeContext, path: Path) -> bool:
+    """Stat each path at most once per scan.
+
+    Scoped to ctx.cache rather than the process so a re-scan observes
+    filesystem changes; several Phase 2 probes stat the same config files.
+    """
+
+    stat_cache: Dict[str, bool] = ctx.cache.setdefault("stat_cache", {})
+    key = str(path)
+    cached = stat_cache.get(key)
+    if cached is None:
+        cached = path.exists()
+        stat_cache[key] = cached
+    return cached
+
+
+@functools.lru_cache(maxsize=16)
+def _skip_result(probe_id: str, summary: str, details: str) -> CheckResult:
+    """SKIP results are identical across scans; build each once per process.
+
+    Safe because CheckResult is frozen.
+    """
+
+    return CheckResult(
+        id=probe_id,
+        phase=2,
+        status=CheckStatus.SKIP,
+        summary=summary,
+        details=details,
+        evidence=(),
+        actions=(),
+    )
+
+
+def _require_ue_path(
+    ctx: ProbeContext, probe_id: str, summary: str, details: str
+) -> Tuple[Optional[Path], Optional[CheckResult]]:
+    """Return the resolved UE root, or a SKIP result when it is absent."""
+
+    ue_path: Optional[Path] = ctx.cache.get("ue_root_path")
+    if ue_path is not None:
+        return ue_path, None
+    return None, _skip_result(probe_id, summary, details)
+
+
 def check_ue_root(ctx: ProbeContext) -> CheckResult:
     if not ctx.ue_root:
         return CheckResult(
@@ -29,7 +111,7 @@ def check_ue_root(ctx: ProbeContext) -> CheckResult:
             status=CheckStatus.WARN,
             summary="No --ue-root provided",
             details="Provide the Unreal Engine source directory via --ue-root to enable deeper checks.",
-            evidence=[],
+            evidence=(),
             actions=[
                 ActionRecommendation(
                     id="ue.provide-root",
@@ -65,26 +147,28 @@ def check_ue_root(ctx: ProbeContext) -> CheckResult:
         summary=f"UE root detected at {ue_path}",
         details="UE root provided; Setup/GenerateProjectFiles checks enabled.",
         evidence=[str(ue_path)],
-        actions=[],
+        actions=(),
     )
 
 
 def check_setup_scripts(ctx: ProbeContext) -> CheckResult:
-    ue_path: Path | None = ctx.cache.get("ue_root_path")
-    if ue_path is None:
-        return CheckResult(
-            id="ue.scripts",
-            phase=2,
-            status=CheckStatus.SKIP,
-            summary="Setup scripts skipped",
-            details="Provide --ue-root to validate Setup.bat and GenerateProjectFiles.bat.",
-            evidence=[],
-            actions=[],
-        )
-
-    setup = ue_path / "Setup.bat"
-    gen = ue_path / "GenerateProjectFiles.bat"
-    missing = [path.name for path in (setup, gen) if not path.exists()]
+    ue_path, skip = _require_ue_path(
+        ctx,
+        "ue.scripts",
+        "Setup scripts skipped",
+        "Provide --ue-root to validate Setup.bat and GenerateProjectFiles.bat.",
+    )
+    if skip is not None:
+        return skip
+
+    setup = _ue_subpath(str(ue_path), "Setup.bat")
+    gen = _ue_subpath(str(ue_path), "GenerateProjectFiles.bat")
+    # One directory enumeration answers both existence questions instead of
+    # stat-ing each batch file individually.
+    names = _dir_snapshot(ctx, ue_path)
+    setup_present = setup.name in names
+    gen_present = gen.name in names
+    missing = [path.name for path, present in ((setup, setup_present), (gen, gen_present)) if not present]
     status = CheckStatus.PASS if not missing else CheckStatus.FAIL
     actions = []
     if missing:
@@ -95,7 +179,7 @@ def check_setup_scripts(ctx: ProbeContext) -> CheckResult:
                 commands=[f"git checkout HEAD -- {' '.join(missing)}"],
             )
         )
-    details = f"Setup.bat: {'present' if setup.exists() else 'missing'}, GPF: {'present' if gen.exists() else 'missing'}"
+    details = f"Setup.bat: {'present' if setup_present else 'missing'}, GPF: {'present' if gen_present else 'missing'}"
     return CheckResult(
         id="ue.scripts",
         phase=2,
@@ -107,40 +191,97 @@ def check_setup_scripts(ctx: ProbeContext) -> CheckResult:
     )
 
 
+# Ordered by preference: the UE prerequisite bundle first, then the plain
+# VC++ redistributables it wraps.
+_REDIST_TARGETS = ("UEPrereqSetup_x64.exe", "vc_redist.x64.exe", "vc_redist.arm64.exe")
+
+
+# Build-output directories that never contain redist installers; pruned from
+# the fallback walk along with anything deeper than UE's Redist/<vendor>/<lang>
+# layout.
+# Windows filenames are case-insensitive and Microsoft ships the standalone
+# installer as VC_redist.x64.exe, so all name matching happens lowercased.
+_REDIST_TARGETS_LOWER = tuple(target.lower() for target in _REDIST_TARGETS)
+_REDIST_PRUNE_DIRS = frozenset({"obj", "intermediate", "temp"})
+_REDIST_MAX_DEPTH = 3
+
+
+def _find_first_installer(root: Path) -> Tuple[Optional[Path], Optional[str]]:
+    """One scandir DFS over the Redist tree, preferring targets in order.
+
+    DirEntry type checks reuse the cached stat from the directory read, and
+    the walk returns immediately once the preferred installer turns up.
+    """
+
+    best_index: Optional[int] = None
+    best_path: Optional[Path] = None
+    stack = [(str(root), 0)]
+    while stack:
+        current, depth = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if depth < _REDIST_MAX_DEPTH and entry.name.lower() not in _REDIST_PRUNE_DIRS:
+                        stack.append((entry.path, depth + 1))
+                    continue
+                name_lower = entry.name.lower()
+                if name_lower not in _REDIST_TARGETS_LOWER or not entry.is_file(follow_symlinks=False):
+                    continue
+                index = _REDIST_TARGETS_LOWER.index(name_lower)
+                if index == 0:
+                    return Path(entry.path), _REDIST_TARGETS[0]
+                if best_index is None or index < best_index:
+                    best_index = index
+                    best_path = Path(entry.path)
+    if best_path is None or best_index is None:
+        return None, None
+    return best_path, _REDIST_TARGETS[best_index]
+
+
 def check_redist_installer(ctx: ProbeContext) -> CheckResult:
-    ue_path: Path | None = ctx.cache.get("ue_root_path")
-    if ue_path is None:
-        return CheckResult(
-            id="ue.redist",
-            phase=2,
-            status=CheckStatus.SKIP,
-            summary="UE prerequisites skipped",
-            details="Provide --ue-root to verify Engine/Extras/Redist installers.",
-            evidence=[],
-            actions=[],
-        )
+    ue_path, skip = _require_ue_path(
+        ctx,
+        "ue.redist",
+        "UE prerequisites skipped",
+        "Provide --ue-root to verify Engine/Extras/Redist installers.",
+    )
+    if skip is not None:
+        return skip
 
     installer = None
-    redist_root = ue_path / "Engine" / "Extras" / "Redist"
+    redist_root = _ue_subpath(str(ue_path), "Engine", "Extras", "Redist")
     found_type = None
-    if redist_root.exists():
-        for exe in redist_root.rglob("UEPrereqSetup_x64.exe"):
-            installer = exe
-            found_type = "UEPrereqSetup_x64.exe"
-            break
-        if installer is None:
-            for exe in redist_root.rglob("vc_redist.x64.exe"):
-                installer = exe
-                found_type = "vc_redist.x64.exe"
-                break
-        if installer is None:
-            for exe in redist_root.rglob("vc_redist.arm64.exe"):
-                installer = exe
-                found_type = "vc_redist.arm64.exe"
-                break
-
-    installed_versions = _detect_installed_redist()
-    exists = installer is not None and installer.exists()
+    # The registry probe and the Redist walk hit independent I/O subsystems,
+    # so kick the registry read off on a worker and overlap it with the
+    # filesystem scan below.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        redist_future = pool.submit(_detect_installed_redist)
+        if _cached_exists(ctx, redist_root):
+            # UE ships the installer at a well-known language-tagged subpath;
+            # probe those first so the common layout costs a couple of stats
+            # instead of a recursive walk.
+            for subdir in ("en-us", ""):
+                base = redist_root / subdir if subdir else redist_root
+                # Lowercase the snapshot for the membership test but keep the
+                # on-disk casing for the path we hand back.
+                names = {name.lower(): name for name in _dir_snapshot(ctx, base)}
+                for target, target_lower in zip(_REDIST_TARGETS, _REDIST_TARGETS_LOWER):
+                    actual = names.get(target_lower)
+                    if actual is not None:
+                        installer = base / actual
+                        found_type = target
+                        break
+                if installer is not None:
+                    break
+            if installer is None:
+                installer, found_type = _find_first_installer(redist_root)
+
+        installed_versions = redist_future.result()
+    exists = installer is not None and _cached_exists(ctx, installer)
     status = CheckStatus.PASS if exists else CheckStatus.WARN
     actions = []
     if not exists:
@@ -186,61 +327,130 @@ def check_redist_installer(ctx: ProbeContext) -> CheckResult:
     )
 
 
+# MSVC redistributables always register under a {GUID} uninstall key, never a
+# human-readable name; filtering on the key name avoids opening most subkeys.
+_MSVC_GUID_RE = re.compile(r"^\{[0-9A-Fa-f-]+\}$")
+
+_REDIST_TARGET_NAMES = frozenset(
+    {
+        "Microsoft Visual C++ 2015-2022 Redistributable (x64)",
+        "Microsoft Visual C++ 2015-2022 Redistributable (Arm64)",
+    }
+)
+
+_redist_cache: Optional[List[str]] = None
+
+
 def _detect_installed_redist() -> List[str]:
-    """Detect installed VC++ 2015-2022 redistributables via registry."""
+    """Detect installed VC++ 2015-2022 redistributables via registry.
+
+    The registry does not change during a scan run, so the result is
+    memoized at module level. Only a non-empty result is memoized: setup
+    installs the redistributables mid-run and then refreshes the scan, so a
+    cached "not installed" answer would mask the fix taking effect. (The
+    disk layer needs no such guard — its key on the Uninstall hives' write
+    times invalidates on install.)
+    """
+    global _redist_cache
+    if _redist_cache is not None:
+        return _redist_cache
     versions: List[str] = []
-    if winreg is None:
+    if not HAS_WINREG:
+        return versions
+
+    # The VC++ runtime writes its installed version to a deterministic key,
+    # so two targeted reads normally answer the question without opening
+    # hundreds of Uninstall subkeys.
+    runtime_keys = (
+        r"SOFTWARE\Microsoft\VisualStudio\14.0\VC\Runtimes\x64",
+        r"SOFTWARE\Microsoft\VisualStudio\14.0\VC\Runtimes\ARM64",
+    )
+    for key_path in runtime_keys:
+        try:
+            with OpenKey(HKLM, key_path, 0, KEY_READ | KEY_WOW64_64KEY) as key:
+                version, _ = QueryValueEx(key, "Version")
+        except (FileNotFoundError, OSError):
+            continue
+        versions.append(str(version).lstrip("v"))
+    if versions:
+        _redist_cache = versions
         return versions
 
     hives = [
-        (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
-        (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall"),
+        (HKLM, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
+        (HKLM, r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall"),
     ]
 
-    target_names = (
-        "Microsoft Visual C++ 2015-2022 Redistributable (x64)",
-        "Microsoft Visual C++ 2015-2022 Redistributable (Arm64)",
-    )
+    # Key the persistent cache on the hives' last-write FILETIMEs so repeat
+    # runs (CI agents) skip the enumeration until something is (un)installed.
+    filetimes: List[int] = []
+    for hive, key_path in hives:
+        try:
+            with OpenKey(hive, key_path) as root:
+                filetimes.append(QueryInfoKey(root)[2])
+        except (FileNotFoundError, OSError):
+            filetimes.append(0)
+    cache_key = ":".join(map(str, filetimes))
+    cached = _disk_cache_get("redist", cache_key)
+    if isinstance(cached, list):
+        versions = [str(item) for item in cached]
+        if versions:
+            _redist_cache = versions
+        return versions
 
+    found: set[str] = set()
     for hive, key_path in hives:
         try:
-            with winreg.OpenKey(hive, key_path) as root:
-                for i in range(0, winreg.QueryInfoKey(root)[0]):
+            with OpenKey(hive, key_path) as root:
+                for i in range(0, QueryInfoKey(root)[0]):
                     try:
-                        subkey_name = winreg.EnumKey(root, i)
-                        with winreg.OpenKey(root, subkey_name) as subkey:
-                            display_name, _ = winreg.QueryValueEx(subkey, "DisplayName")
-                            if display_name not in target_names:
+                        subkey_name = EnumKey(root, i)
+                        if not _MSVC_GUID_RE.match(subkey_name):
+                            continue
+                        # Query-only access, and skip subkeys too sparse to
+                        # be a redist entry (they always carry DisplayName,
+                        # DisplayVersion and Publisher at minimum).
+                        with OpenKey(root, subkey_name, 0, KEY_QUERY_VALUE) as subkey:
+                            if QueryInfoKey(subkey)[1] < 3:
+                                continue
+                            display_name, name_type = QueryValueEx(subkey, "DisplayName")
+                            if name_type != REG_SZ or display_name not in _REDIST_TARGET_NAMES:
                                 continue
-                            display_version, _ = winreg.QueryValueEx(subkey, "DisplayVersion")
+                            display_version, _ = QueryValueEx(subkey, "DisplayVersion")
                             versions.append(str(display_version))
+                            found.add(display_name)
                     except FileNotFoundError:
                         continue
                     except OSError:
                         continue
+                    if len(found) == len(_REDIST_TARGET_NAMES):
+                        break
         except FileNotFoundError:
             continue
+        if len(found) == len(_REDIST_TARGET_NAMES):
+            break
+    _disk_cache_put("redist", cache_key, versions)
+    if versions:
+        _redist_cache = versions
     return versions
 
 
 def check_build_commands(ctx: ProbeContext) -> CheckResult:
-    ue_path: Path | None = ctx.cache.get("ue_root_path")
-    if ue_path is None:
-        return CheckResult(
-            id="ue.commands",
-            phase=2,
-            status=CheckStatus.SKIP,
-            summary="Build command guidance skipped",
-            details="Provide --ue-root to receive tailored Build.bat / editor commands.",
-            evidence=[],
-            actions=[],
-        )
+    ue_path, skip = _require_ue_path(
+        ctx,
+        "ue.commands",
+        "Build command guidance skipped",
+        "Provide --ue-root to receive tailored Build.bat / editor commands.",
+    )
+    if skip is not None:
+        return skip
 
-    build_bat = ue_path / "Engine" / "Build" / "BatchFiles" / "Build.bat"
-    uat = ue_path / "Engine" / "Build" / "BatchFiles" / "RunUAT.bat"
+    build_bat = _ue_subpath(str(ue_path), "Engine", "Build", "BatchFiles", "Build.bat")
+    uat = _ue_subpath(str(ue_path), "Engine", "Build", "BatchFiles", "RunUAT.bat")
+    build_graph = _ue_subpath(str(ue_path), "Engine", "Build", "InstalledEngineBuild.xml")
     commands = [
         f'"{build_bat}" UE5Editor Win64 Development -TargetType=Editor',
-        f'"{uat}" BuildGraph -Target="Make Installed Build Win64" -Script="{ue_path / "Engine" / "Build" / "InstalledEngineBuild.xml"}"',
+        f'"{uat}" BuildGraph -Target="Make Installed Build Win64" -Script="{build_graph}"',
     ]
     return CheckResult(
         id="ue.commands",
@@ -260,19 +470,31 @@ def check_build_commands(ctx: ProbeContext) -> CheckResult:
 
 
 def check_engine_build(ctx: ProbeContext) -> CheckResult:
-    ue_path: Path | None = ctx.cache.get("ue_root_path")
-    if ue_path is None:
+    ue_path, skip = _require_ue_path(
+        ctx,
+        "ue.engine-build",
+        "Engine Build Completeness: SKIP",
+        "Provide --ue-root to verify UnrealEditor/ShaderCompileWorker/UnrealPak/CrashReportClient binaries.",
+    )
+    if skip is not None:
+        return skip
+
+    targets_override = ctx.cache.get("engine_build_targets")
+    # Happy path: every canonical binary exists, so the full resolver plan
+    # (artifact cache load, bounded searches) is unnecessary — a stat per
+    # target answers the probe, and the details match a resolver SKIP line.
+    binaries = canonical_binaries(ue_path, targets_override)
+    if all(binary.name in _dir_snapshot(ctx, binary.parent) for _, binary in binaries):
         return CheckResult(
             id="ue.engine-build",
             phase=2,
-            status=CheckStatus.SKIP,
-            summary="Engine Build Completeness: SKIP",
-            details="Provide --ue-root to verify UnrealEditor/ShaderCompileWorker/UnrealPak/CrashReportClient binaries.",
-            evidence=[],
-            actions=[],
+            status=CheckStatus.PASS,
+            summary=f"Engine Build Completeness: {CheckStatus.PASS.value}",
+            details="; ".join(f"SKIP: {target.name} [{binary}]" for target, binary in binaries),
+            evidence=[str(binary) for _, binary in binaries],
+            actions=(),
         )
 
-    targets_override = ctx.cache.get("engine_build_targets")
     resolver = ArtifactResolver(ue_path)
     plan = determine_build_plan(ue_path, targets_override, resolver=resolver)
     missing = missing_targets(plan)
@@ -291,7 +513,7 @@ def check_engine_build(ctx: ProbeContext) -> CheckResult:
             )
         )
 
-    evidence = [str(item.resolved or item.canonical) for item in plan]
+    evidence = tuple(map(str, (item.resolved or item.canonical for item in plan)))
     return CheckResult(
         id="ue.engine-build",
         phase=2,
@@ -303,15 +525,37 @@ def check_engine_build(ctx: ProbeContext) -> CheckResult:
     )
 
 
+_WANTED_BUILD_FLAGS = frozenset(
+    ("bAllowXGE", "bAllowRemoteBuilds", "bUseHordeAgent", "bAllowXGEShaderCompile")
+)
+
+
 def _parse_build_configuration_flags(xml_text: str) -> Dict[str, bool]:
-    """Backward-compatible wrapper that retains the probe contract."""
+    """Extract just the distribution flags the probe cares about.
 
-    all_flags = parse_build_configuration_flags(xml_text)
-    filtered: Dict[str, bool] = {}
-    for key in ("bAllowXGE", "bAllowRemoteBuilds", "bUseHordeAgent", "bAllowXGEShaderCompile"):
-        if key in all_flags:
-            filtered[key] = all_flags[key]
-    return filtered
+    Streams the XML and stops as soon as all four flags have been seen,
+    unlike the generic parser which must collect every element.
+    """
+
+    # Deferred: xml.etree costs tens of milliseconds of cold startup and is
+    # only needed once a BuildConfiguration.xml is actually being inspected.
+    # After the first call both imports are sys.modules dict hits.
+    import xml.etree.ElementTree as ET
+
+    from ue_configurator.ue.build_config import _parse_bool
+
+    flags: Dict[str, bool] = {}
+    try:
+        for _, elem in ET.iterparse(io.StringIO(xml_text), events=("end",)):
+            tag = elem.tag.rpartition("}")[2]
+            if tag in _WANTED_BUILD_FLAGS and elem.text:
+                flags[tag] = _parse_bool(elem.text)
+                if len(flags) == len(_WANTED_BUILD_FLAGS):
+                    break
+            elem.clear()
+    except ET.ParseError:
+        return {}
+    return flags
 
 
 @dataclass
@@ -322,53 +566,74 @@ class BuildConfigurationInspection:
     details: str
 
 
-def inspect_build_configuration(ue_root: Path | None) -> BuildConfigurationInspection:
+# Parsed BuildConfiguration.xml keyed by path; (mtime_ns, size) invalidates
+# the entry when the file changes, so fix/apply flows re-reading the same
+# file within a process skip the read and XML parse.
+_BUILD_CONFIG_CACHE: Dict[str, Tuple[int, int, BuildConfigurationInspection]] = {}
+
+
+def inspect_build_configuration(
+    ue_root: Path | None, ctx: ProbeContext | None = None
+) -> BuildConfigurationInspection:
     paths: List[Path] = [config_paths.user_build_configuration_path()]
     if ue_root:
         paths.append(config_paths.engine_build_configuration_path(ue_root))
     for path in paths:
-        if not path.exists():
+        # With a context, one listing of the parent directory (shared with
+        # the other Phase 2 probes) answers existence for every candidate.
+        exists = path.name in _dir_snapshot(ctx, path.parent) if ctx is not None else path.exists()
+        if not exists:
             continue
+        key = str(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+        if st is not None:
+            cached = _BUILD_CONFIG_CACHE.get(key)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return cached[2]
         try:
             text = path.read_text(encoding="utf-8", errors="ignore")
         except OSError:
             return BuildConfigurationInspection(path=path, flags={}, status="unreadable", details="Unreadable file.")
         flags = _parse_build_configuration_flags(text)
         if not flags:
-            return BuildConfigurationInspection(
+            inspection = BuildConfigurationInspection(
                 path=path,
                 flags=flags,
                 status="no-flags",
                 details=f"{path}: no relevant flags",
             )
-        enabled = any(flags.values())
-        status = "enabled" if enabled else "disabled"
-        detail_flags = ", ".join(f"{k}={v}" for k, v in sorted(flags.items()))
-        return BuildConfigurationInspection(
-            path=path,
-            flags=flags,
-            status=status,
-            details=f"{path}: {detail_flags}",
-        )
+        else:
+            enabled = any(flags.values())
+            status = "enabled" if enabled else "disabled"
+            detail_flags = ", ".join(f"{k}={v}" for k, v in sorted(flags.items()))
+            inspection = BuildConfigurationInspection(
+                path=path,
+                flags=flags,
+                status=status,
+                details=f"{path}: {detail_flags}",
+            )
+        if st is not None:
+            _BUILD_CONFIG_CACHE[key] = (st.st_mtime_ns, st.st_size, inspection)
+        return inspection
     return BuildConfigurationInspection(path=None, flags={}, status="missing", details="No BuildConfiguration.xml found.")
 
 
 def check_shader_distribution(ctx: ProbeContext) -> CheckResult:
     """Report whether distributed shader compilation is configured."""
 
-    ue_path: Path | None = ctx.cache.get("ue_root_path")
-    if ue_path is None:
-        return CheckResult(
-            id="ue.shader-distribution",
-            phase=2,
-            status=CheckStatus.SKIP,
-            summary="Shader distribution detection skipped",
-            details="Provide --ue-root to inspect BuildConfiguration.xml for XGE/Horde flags.",
-            evidence=[],
-            actions=[],
-        )
+    ue_path, skip = _require_ue_path(
+        ctx,
+        "ue.shader-distribution",
+        "Shader distribution detection skipped",
+        "Provide --ue-root to inspect BuildConfiguration.xml for XGE/Horde flags.",
+    )
+    if skip is not None:
+        return skip
 
-    inspection = inspect_build_configuration(ue_path)
+    inspection = inspect_build_configuration(ue_path, ctx)
     if inspection.status == "missing":
         return CheckResult(
             id="ue.shader-distribution",
@@ -393,7 +658,7 @@ def check_shader_distribution(ctx: ProbeContext) -> CheckResult:
             summary="Distributed shader compile: unreadable config",
             details=inspection.details,
             evidence=[inspection.details],
-            actions=[],
+            actions=(),
         )
 
     distributed = inspection.status == "enabled"
@@ -412,68 +677,71 @@ def check_shader_distribution(ctx: ProbeContext) -> CheckResult:
         summary=summary,
         details=details,
         evidence=[details],
-        actions=[],
+        actions=(),
     )
 
 
-def _extract_paths_from_text(text: str) -> List[str]:
+# Matches only lines mentioning a DDC marker and carrying a key=value pair;
+# the regex engine skips the (vastly more numerous) irrelevant ini lines
+# without per-line Python-level splitting. A bytes pattern so it can run
+# over raw file contents (including mmap buffers) without a full decode.
+_DDC_LINE_RE = re.compile(rb"^(?=.*(?:DerivedData|Cache))([^=\r\n]+)=(.*)$", re.MULTILINE)
+
+_HOME_LOWER = str(Path.home()).lower()
+
+
+def _extract_paths_from_bytes(data: bytes | mmap.mmap) -> List[str]:
+    # Cheap containment check first: most ini files mention neither marker,
+    # and one C-level substring scan beats running the regex at all.
+    if data.find(b"DerivedData") < 0 and data.find(b"Cache") < 0:
+        return []
     paths: List[str] = []
-    for line in text.splitlines():
-        if "=" not in line:
-            continue
-        key, raw_value = line.split("=", 1)
-        key = key.strip()
-        if not any(token in key for token in ("DerivedData", "Cache")) and not any(
-            token in raw_value for token in ("DerivedData", "Cache")
-        ):
-            continue
-        # Pull out Path= tokens inside structured config blobs
+    for match in _DDC_LINE_RE.finditer(data):
+        raw_value = match.group(2)
+        # Pull out Path= tokens inside structured config blobs; only the
+        # surviving candidates pay for a UTF-8 decode.
         candidates: List[str] = []
-        for token in raw_value.split(","):
+        for token in raw_value.split(b","):
             token = token.strip()
-            if "DerivedData" not in token and "Cache" not in token and not token.startswith("Path="):
+            if b"DerivedData" not in token and b"Cache" not in token and not token.startswith(b"Path="):
                 continue
-            if token.startswith("Path="):
-                value = token.split("=", 1)[1]
+            if token.startswith(b"Path="):
+                value = token.split(b"=", 1)[1]
             else:
                 value = token
-            value = value.strip().strip('"').strip("'")
+            value = value.strip().strip(b'"').strip(b"'")
             if value:
-                candidates.append(value)
+                candidates.append(value.decode("utf-8", "ignore"))
         if not candidates and raw_value.strip():
-            candidates.append(raw_value.strip().strip('"').strip("'"))
+            candidates.append(raw_value.strip().strip(b'"').strip(b"'").decode("utf-8", "ignore"))
         paths.extend(candidates)
     return paths
 
 
-def _classify_ddc_path(path_text: str, ue_path: Path | None, default_local: Path | None) -> str:
-    lower = path_text.lower()
+def _norm_prefix(path: Path | None) -> Optional[str]:
+    """Normalize a reference path once for repeated prefix tests."""
+
+    if path is None:
+        return None
+    return os.path.normcase(os.path.normpath(str(path)))
+
+
+def _classify_ddc_path(path_text: str, local_prefixes: Tuple[str, ...]) -> str:
     if not path_text:
         return "unknown"
+    lower = path_text.lower()
     if lower.startswith("\\\\") or "://" in lower:
         return "shared"
-    path_obj = Path(path_text)
-    try:
-        resolved = path_obj.expanduser()
-    except Exception:
-        resolved = path_obj
-    if default_local:
-        try:
-            if resolved.resolve().is_relative_to(default_local):
-                return "local"
-        except Exception:
-            if str(default_local).lower() in lower:
-                return "local"
-    if ue_path:
-        try:
-            if resolved.resolve().is_relative_to(ue_path):
-                return "local"
-        except Exception:
-            if str(ue_path).lower() in lower:
-                return "local"
-    if str(Path.home()).lower() in lower:
+    # Purely lexical comparison: classification only needs prefix matching,
+    # and resolve() would stat every path component (or stall outright on an
+    # unreachable share). The reference prefixes are normalized once by the
+    # caller, and startswith takes them as one tuple in a single C call.
+    norm = os.path.normcase(os.path.normpath(os.path.expanduser(path_text)))
+    if local_prefixes and norm.startswith(local_prefixes):
         return "local"
-    if resolved.is_absolute():
+    if _HOME_LOWER in lower:
+        return "local"
+    if os.path.isabs(norm):
         return "shared"
     return "unknown"
 
@@ -481,17 +749,14 @@ def _classify_ddc_path(path_text: str, ue_path: Path | None, default_local: Path
 def check_ddc_configuration(ctx: ProbeContext) -> CheckResult:
     """Detect shared vs local Derived Data Cache usage."""
 
-    ue_path: Path | None = ctx.cache.get("ue_root_path")
-    if ue_path is None:
-        return CheckResult(
-            id="ue.ddc",
-            phase=2,
-            status=CheckStatus.SKIP,
-            summary="DDC detection skipped",
-            details="Provide --ue-root to inspect Derived Data Cache configuration.",
-            evidence=[],
-            actions=[],
-        )
+    ue_path, skip = _require_ue_path(
+        ctx,
+        "ue.ddc",
+        "DDC detection skipped",
+        "Provide --ue-root to inspect Derived Data Cache configuration.",
+    )
+    if skip is not None:
+        return skip
 
     local_default = None
     if os.environ.get("LOCALAPPDATA"):
@@ -500,35 +765,50 @@ def check_ddc_configuration(ctx: ProbeContext) -> CheckResult:
     env_local = os.environ.get("UE-LocalDataCachePath")
     env_shared = os.environ.get("UE-SharedDataCachePathOverride") or os.environ.get("UE-SharedDataCachePath")
 
+    root = str(ue_path)
     configs = [
-        ue_path / "Engine" / "Config" / "DefaultEngine.ini",
-        ue_path / "Engine" / "Config" / "BaseEngine.ini",
-        ue_path / "Engine" / "Saved" / "Config" / "Windows" / "Engine.ini",
-        ue_path / "Engine" / "Programs" / "UnrealBuildTool" / "Config" / "UnrealBuildTool.ini",
-        ue_path / "Engine" / "Config" / "DerivedDataCache.ini",
+        _ue_subpath(root, "Engine", "Config", "DefaultEngine.ini"),
+        _ue_subpath(root, "Engine", "Config", "BaseEngine.ini"),
+        _ue_subpath(root, "Engine", "Saved", "Config", "Windows", "Engine.ini"),
+        _ue_subpath(root, "Engine", "Programs", "UnrealBuildTool", "Config", "UnrealBuildTool.ini"),
+        _ue_subpath(root, "Engine", "Config", "DerivedDataCache.ini"),
         config_paths.user_ddc_config_path(),
     ]
 
-    discovered_paths: List[str] = []
+    # Insertion-ordered dicts de-dupe at collection time, so inherited ini
+    # entries are classified once and the display join needs no second pass.
+    discovered_paths: Dict[str, None] = {}
     for cfg in configs:
-        if not cfg.exists():
+        if cfg.name not in _dir_snapshot(ctx, cfg.parent):
             continue
+        # Memory-map and scan the raw bytes in place; BaseEngine.ini can top
+        # a megabyte, and only the handful of captured path tokens ever pay
+        # for a decode. A racing delete just falls through to the next config.
         try:
-            text = cfg.read_text(encoding="utf-8", errors="ignore")
+            with cfg.open("rb") as fp:
+                try:
+                    mapped = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:  # zero-length files cannot be mapped
+                    continue
+                with mapped:
+                    found_paths = _extract_paths_from_bytes(mapped)
         except OSError:
             continue
-        discovered_paths.extend(_extract_paths_from_text(text))
+        discovered_paths.update((path, None) for path in found_paths)
 
     if env_local:
-        discovered_paths.append(env_local)
+        discovered_paths[env_local] = None
     if env_shared:
-        discovered_paths.append(env_shared)
+        discovered_paths[env_shared] = None
 
     local_paths: List[str] = []
     shared_paths: List[str] = []
     unknown_paths: List[str] = []
+    local_prefixes = tuple(
+        prefix for prefix in (_norm_prefix(local_default), _norm_prefix(ue_path)) if prefix
+    )
     for path_text in discovered_paths:
-        classification = _classify_ddc_path(path_text, ue_path, local_default)
+        classification = _classify_ddc_path(path_text, local_prefixes)
         if classification == "local":
             local_paths.append(path_text)
         elif classification == "shared":
@@ -548,17 +828,17 @@ def check_ddc_configuration(ctx: ProbeContext) -> CheckResult:
     if shared_paths:
         status = CheckStatus.PASS
         summary = "DDC: shared cache configured"
-        details = f"Shared: {', '.join(dict.fromkeys(shared_paths))}"
+        details = f"Shared: {', '.join(shared_paths)}"
         if local_paths:
-            details += f" | Local fallback: {', '.join(dict.fromkeys(local_paths))}"
+            details += f" | Local fallback: {', '.join(local_paths)}"
     elif unknown_paths:
         status = CheckStatus.WARN
         summary = "DDC: unable to confirm shared cache"
-        details = f"Paths found but classification uncertain: {', '.join(dict.fromkeys(unknown_paths))}"
+        details = f"Paths found but classification uncertain: {', '.join(unknown_paths)}"
     elif local_paths:
         status = CheckStatus.WARN
         summary = "DDC: local-only"
-        details = f"Local cache in use: {', '.join(dict.fromkeys(local_paths))}"
+        details = f"Local cache in use: {', '.join(local_paths)}"
     else:
         status = CheckStatus.WARN
         summary = "DDC: configuration not found"
@@ -571,7 +851,7 @@ def check_ddc_configuration(ctx: ProbeContext) -> CheckResult:
         summary=summary,
         details=details,
         evidence=evidence,
-        actions=[],
+        actions=(),
     )
 
 
@@ -584,3 +864,18 @@ PHASE2_PROBES = [
     check_shader_distribution,
     check_ddc_configuration,
 ]
+
+
+def run_phase2(ctx: ProbeContext) -> List[CheckResult]:
+    """Run Phase 2 probes, fanning the independent ones out concurrently.
+
+    check_ue_root runs first because it primes ctx.cache["ue_root_path"]
+    for everything else; the remaining probes touch disjoint filesystem and
+    registry paths, so overlapping their I/O collapses the phase wall time
+    to roughly the slowest single probe.
+    """
+
+    results = [check_ue_root(ctx)]
+    futures = [ctx.executor.submit(probe, ctx) for probe in PHASE2_PROBES[1:]]
+    results.extend(future.result() for future in futures)
+    return results
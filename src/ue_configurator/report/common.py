@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
 from typing import Dict, Iterable, List, Tuple
 
 from ue_configurator.probe.base import ActionRecommendation, CheckResult, CheckStatus
@@ -22,6 +24,12 @@ class ConsoleTheme:
 
     def __init__(self, *, no_color: bool = False):
         self.no_color = no_color
+        # Only five statuses exist, so render every label up front and make
+        # status_label a plain dict hit instead of per-check f-string work.
+        self._cached_labels = {
+            status: self.colorize(status.value, self.STATUS_COLORS.get(status, "37"))
+            for status in CheckStatus
+        }
 
     def colorize(self, text: str, color_code: str) -> str:
         if self.no_color:
@@ -29,24 +37,26 @@ class ConsoleTheme:
         return f"\x1b[{color_code}m{text}\x1b[0m"
 
     def status_label(self, status: CheckStatus) -> str:
-        code = self.STATUS_COLORS.get(status, "37")
-        return self.colorize(status.value, code)
+        return self._cached_labels[status]
 
     def progress_bar(self, completed: int, total: int, width: int = 28) -> str:
         if total == 0:
             return "[" + "-" * width + "]"
-        completed_blocks = int(width * (completed / total))
-        bar = "#" * completed_blocks + "-" * (width - completed_blocks)
-        return f"[{bar}] {completed}/{total}"
+        return f"[{_progress_bar_body(completed, total, width)}] {completed}/{total}"
+
+
+@lru_cache(maxsize=64)
+def _progress_bar_body(completed: int, total: int, width: int) -> str:
+    completed_blocks = int(width * (completed / total))
+    return "#" * completed_blocks + "-" * (width - completed_blocks)
 
 
 def collect_actions(results: Dict[int, List[CheckResult]]) -> List[ActionRecommendation]:
     unique: Dict[str, ActionRecommendation] = {}
-    for checks in results.values():
-        for check in checks:
-            if check.status in (CheckStatus.PASS, CheckStatus.NA):
-                continue
-            for action in check.actions:
-                if action.id not in unique:
-                    unique[action.id] = action
+    for check in chain.from_iterable(results.values()):
+        if check.status in (CheckStatus.PASS, CheckStatus.NA):
+            continue
+        for action in check.actions:
+            # setdefault keeps the first occurrence with a single hash lookup.
+            unique.setdefault(action.id, action)
     return list(unique.values())
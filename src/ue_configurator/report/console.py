@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import shutil
+import sys
 from typing import Dict, List
 
 from ue_configurator.probe.base import CheckResult, CheckStatus, score_checks
@@ -21,14 +22,17 @@ def _terminal_width() -> int:
 def render_console(scan: ScanData, *, theme: ConsoleTheme, verbose: bool = False) -> None:
     metadata = scan.metadata
     width = _terminal_width()
+    # Accumulate the whole report and emit it with one write; per-line print
+    # calls each take the stdout lock and flush on a TTY.
+    out: List[str] = []
     header = f"{metadata.get('machine', '<machine>')} — {metadata.get('timestamp', '')}"
-    print(header)
-    print("-" * min(len(header), width))
+    out.append(header + "\n")
+    out.append("-" * min(len(header), width) + "\n")
     manifest_id = metadata.get("manifestId")
     if manifest_id:
         fingerprint = metadata.get("manifestFingerprint", "")[:12]
         ue_version = metadata.get("ueVersion", "")
-        print(f"Manifest: {manifest_id} (UE {ue_version}) — fingerprint {fingerprint}")
+        out.append(f"Manifest: {manifest_id} (UE {ue_version}) — fingerprint {fingerprint}\n")
 
     for phase in sorted(scan.results):
         phase_name, _ = PHASE_MAP[phase]
@@ -38,33 +42,34 @@ def render_console(scan: ScanData, *, theme: ConsoleTheme, verbose: bool = False
         progress = theme.progress_bar(completed, len(checks))
         mode = scan.phase_modes.get(phase, "required")
         if mode == "na":
-            print(f"{phase_name} — N/A for {scan.profile.value} profile")
+            out.append(f"{phase_name} — N/A for {scan.profile.value} profile\n")
         else:
-            print(f"{phase_name} ({phase_score:.0f}/100)")
-            print(progress)
+            out.append(f"{phase_name} ({phase_score:.0f}/100)\n")
+            out.append(progress + "\n")
         for check in checks:
             status = theme.status_label(check.status)
-            print(f" - {status} {check.summary}")
+            out.append(f" - {status} {check.summary}\n")
             if verbose or check.status != CheckStatus.PASS:
-                print(f"   {check.details}")
+                out.append(f"   {check.details}\n")
                 if (verbose or check.status != CheckStatus.PASS) and check.evidence:
-                    print(f"   Evidence: {check.evidence[0]}")
-        print()
+                    out.append(f"   Evidence: {check.evidence[0]}\n")
+        out.append("\n")
 
     total_score = scan.total_score()
-    print(f"Final readiness: {total_score:.0f}/100")
+    out.append(f"Final readiness: {total_score:.0f}/100\n")
     for phase, checks in scan.results.items():
         mode = scan.phase_modes.get(phase, "required")
         if mode == "na":
-            print(f"  Phase {phase}: N/A ({scan.profile.value} profile)")
+            out.append(f"  Phase {phase}: N/A ({scan.profile.value} profile)\n")
             continue
         phase_score, _ = score_checks(checks)
-        print(f"  Phase {phase}: {phase_score:.0f}/100")
+        out.append(f"  Phase {phase}: {phase_score:.0f}/100\n")
 
     actions = collect_actions(scan.results)
     if actions:
-        print("\nNext actions:")
+        out.append("\nNext actions:\n")
         for idx, action in enumerate(actions, start=1):
-            print(f" {idx}. {action.description}")
+            out.append(f" {idx}. {action.description}\n")
             for cmd in action.commands:
-                print(f"    {cmd}")
+                out.append(f"    {cmd}\n")
+    sys.stdout.write("".join(out))
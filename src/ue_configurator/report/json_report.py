@@ -5,6 +5,11 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+try:  # pragma: no cover - optional speedup for large reports
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
 from ue_configurator.probe.runner import PHASE_MAP, ScanData
 
 from .common import collect_actions
@@ -36,4 +41,10 @@ def write_json(scan: ScanData, path: str) -> None:
     }
     output = Path(path)
     output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text(json.dumps(document, indent=2), encoding="utf-8")
+    if orjson is not None:
+        # orjson emits UTF-8 bytes directly, skipping the str->bytes encode.
+        output.write_bytes(orjson.dumps(document, option=orjson.OPT_INDENT_2))
+    else:
+        # Stream through the handle instead of building one giant string.
+        with output.open("w", encoding="utf-8") as fp:
+            json.dump(document, fp, indent=2)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import os.path
 import socket
-from datetime import datetime
+import sys
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Sequence
 
@@ -11,12 +14,65 @@ from ue_configurator.profile import Profile
 from ue_configurator.probe.base import ProbeContext
 from ue_configurator.setup.pipeline import SetupRuntime
 
+# The hostname cannot change within a process and gethostname() is a syscall;
+# resolve it (and the version string) once at import.
+_HOST = socket.gethostname()
+_VERSION = __version__
+_RULE = "=" * 60
+
 
 def _manifest_summary(manifest: Optional[Manifest], manifest_source: Optional[str]) -> str:
     if not manifest:
         return "None"
     path = Path(manifest_source) if manifest_source else None
-    return f"{manifest.id} (UE {manifest.ue_version}) fingerprint {manifest.fingerprint[:12]} @ {path or 'resolved'}"
+    return f"{manifest.id} (UE {manifest.ue_version}) fingerprint {manifest.short_fingerprint} @ {path or 'resolved'}"
+
+
+@lru_cache(maxsize=32)
+def _banner_template(
+    command: str,
+    apply: bool,
+    requires_admin: bool,
+    has_note: bool,
+    has_ue_root: bool,
+    has_plan: bool,
+    has_log: bool,
+    has_json: bool,
+    build_engine: bool,
+    register_engine: bool,
+) -> str:
+    """Pre-join the banner skeleton for one shape of invocation.
+
+    Everything that depends only on which flags are set is baked into a
+    single format string, so repeat renders (common in test suites) skip
+    the fifteen-branch line builder and do one format_map substitution.
+    """
+
+    lines = [_RULE]
+    lines.append(f"UE Dev Configurator {_VERSION} — {command.upper()}  [{_HOST} @ {{now}}]")
+    mode = "apply" if apply else "dry-run/plan"
+    lines.append(f"Profile: {{profile}} | Phases: {{phases}} | Mode: {mode}")
+    if requires_admin:
+        lines.append("NOTE: Some steps may require administrator rights.")
+    lines.append("Manifest: {manifest}")
+    if has_note:
+        lines.append("Manifest note: {manifest_note}")
+    if has_ue_root:
+        lines.append("UE root: {ue_root}")
+    if has_plan:
+        lines.append("Plan: {plan_steps} steps (overview below)")
+    if has_log:
+        lines.append("Log: {log_path}")
+    if has_json:
+        lines.append("JSON report: {json_path}")
+    if build_engine:
+        lines.append("Engine build: enabled (--build-engine); targets: {targets}")
+    if register_engine:
+        lines.append("Engine registration: enabled (--register-engine)")
+    lines.append("What happens: readiness checks, manifest compliance, and guidance. Cancel anytime; rerun is safe.")
+    lines.append("Tips: use --help for options; add --verbose for more detail; --run-prereqs to execute redistributables.")
+    lines.append(_RULE)
+    return "\n".join(lines)
 
 
 def format_startup_banner(
@@ -38,34 +94,34 @@ def format_startup_banner(
     build_targets: Optional[Sequence[str]] = None,
     register_engine: bool = False,
 ) -> str:
-    now = datetime.now().isoformat(timespec="seconds")
-    host = socket.gethostname()
-    lines = []
-    lines.append("=" * 60)
-    lines.append(f"UE Dev Configurator {__version__} — {command.upper()}  [{host} @ {now}]")
-    lines.append(f"Profile: {profile.value} | Phases: {', '.join(str(p) for p in phases) or 'n/a'} | Mode: {'apply' if apply else 'dry-run/plan'}")
-    if requires_admin:
-        lines.append("NOTE: Some steps may require administrator rights.")
-    lines.append(f"Manifest: {_manifest_summary(manifest, manifest_source)}")
-    if manifest_note:
-        lines.append(f"Manifest note: {manifest_note}")
-    if ue_root:
-        lines.append(f"UE root: {ue_root}")
-    if plan_steps is not None:
-        lines.append(f"Plan: {plan_steps} steps (overview below)")
-    if log_path:
-        lines.append(f"Log: {Path(log_path).resolve()}")
-    if json_path:
-        lines.append(f"JSON report: {Path(json_path).resolve()}")
-    if build_engine:
-        targets = ", ".join(build_targets) if build_targets else "UnrealEditor, ShaderCompileWorker, UnrealPak, CrashReportClient"
-        lines.append(f"Engine build: enabled (--build-engine); targets: {targets}")
-    if register_engine:
-        lines.append("Engine registration: enabled (--register-engine)")
-    lines.append("What happens: readiness checks, manifest compliance, and guidance. Cancel anytime; rerun is safe.")
-    lines.append("Tips: use --help for options; add --verbose for more detail; --run-prereqs to execute redistributables.")
-    lines.append("=" * 60)
-    return "\n".join(lines)
+    template = _banner_template(
+        command,
+        apply,
+        requires_admin,
+        bool(manifest_note),
+        bool(ue_root),
+        plan_steps is not None,
+        bool(log_path),
+        bool(json_path),
+        build_engine,
+        register_engine,
+    )
+    return template.format_map(
+        {
+            "now": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "profile": profile.value,
+            "phases": ", ".join(map(str, phases)) or "n/a",
+            "manifest": _manifest_summary(manifest, manifest_source),
+            "manifest_note": manifest_note,
+            "ue_root": ue_root,
+            "plan_steps": plan_steps,
+            "log_path": os.path.abspath(log_path) if log_path else None,
+            "json_path": os.path.abspath(json_path) if json_path else None,
+            "targets": ", ".join(build_targets)
+            if build_targets
+            else "UnrealEditor, ShaderCompileWorker, UnrealPak, CrashReportClient",
+        }
+    )
 
 
 def format_minimal_banner(
@@ -74,20 +130,19 @@ def format_minimal_banner(
     log_path: Optional[str],
     ue_root: Optional[str],
 ) -> str:
-    now = datetime.now().isoformat(timespec="seconds")
-    host = socket.gethostname()
-    lines = []
-    lines.append("=" * 60)
-    lines.append(f"UE Dev Configurator {__version__} — {command.upper()}  [{host} @ {now}]")
-    if ue_root:
-        lines.append(f"UE root: {ue_root}")
-    if log_path:
-        lines.append(f"Log: {Path(log_path).resolve()}")
-    if json_path:
-        lines.append(f"JSON report: {Path(json_path).resolve()}")
-    lines.append("Preparing to resolve manifest/profile... You can cancel anytime.")
-    lines.append("=" * 60)
-    return "\n".join(lines)
+    now = time.strftime("%Y-%m-%dT%H:%M:%S")
+    # Fixed-shape banner: one tuple literal, absent lines yield None and are
+    # filtered in the join, so there is no append-driven list growth.
+    parts = (
+        _RULE,
+        f"UE Dev Configurator {_VERSION} — {command.upper()}  [{_HOST} @ {now}]",
+        f"UE root: {ue_root}" if ue_root else None,
+        f"Log: {os.path.abspath(log_path)}" if log_path else None,
+        f"JSON report: {os.path.abspath(json_path)}" if json_path else None,
+        "Preparing to resolve manifest/profile... You can cancel anytime.",
+        _RULE,
+    )
+    return "\n".join(part for part in parts if part is not None)
 
 
 def print_startup_banner_for_runtime(runtime: SetupRuntime, command: str, plan_steps: Optional[int] = None) -> None:
@@ -109,4 +164,6 @@ def print_startup_banner_for_runtime(runtime: SetupRuntime, command: str, plan_s
         build_targets=runtime.options.build_targets,
         register_engine=runtime.options.register_engine,
     )
-    print(banner)
+    # One write/encode/flush instead of print's two locked writes.
+    sys.stdout.write(banner + "\n")
+    sys.stdout.flush()
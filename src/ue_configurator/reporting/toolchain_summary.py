@@ -2,73 +2,85 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Callable, List, Optional, Tuple
 
 from ue_configurator.manifest.manifest_types import WindowsSDKRequirement
 from ue_configurator.probe.base import CheckResult, CheckStatus
 from ue_configurator.probe.runner import ScanData
 
 
-def _get(scan: ScanData, check_id: str) -> Optional[CheckResult]:
-    for checks in scan.results.values():
-        for check in checks:
-            if check.id == check_id:
-                return check
+def _check_index(scan: ScanData) -> dict[str, CheckResult]:
+    """One flat {check.id: check} index; the render does ~10 lookups."""
+
+    return {check.id: check for checks in scan.results.values() for check in checks}
+
+
+def _fmt_details(check: CheckResult) -> str:
+    return check.details
+
+
+def _fmt_summary_details(check: CheckResult) -> str:
+    return f"{check.summary} | {check.details}"
+
+
+def _is_unverified(check: CheckResult) -> bool:
+    # The structured flag is authoritative; the substring scan only covers
+    # results produced before verification tracking existed.
+    if check.verification is not None:
+        return check.verification == "unverified"
+    return "UNVERIFIED" in check.summary
+
+
+def _fmt_vs(check: CheckResult) -> str:
+    verification = "UNVERIFIED" if _is_unverified(check) else check.status.value
+    return f"{check.details} (component verification: {verification})"
+
+
+def _note_vs(check: CheckResult) -> Optional[str]:
+    if _is_unverified(check):
+        return "VS component list unavailable; validated via toolchain artifacts instead."
     return None
 
 
-def _line(label: str, value: str) -> str:
-    return f"- {label}: {value}"
+def _note_sdk(check: CheckResult) -> Optional[str]:
+    if check.status == CheckStatus.WARN:
+        return check.message
+    return None
+
+
+# (check id, row label, value formatter, optional drift-note extractor).
+# One loop body over these rows replaces ten copy-pasted lookup branches.
+_ROWS: Tuple[
+    Tuple[str, str, Callable[[CheckResult], str], Optional[Callable[[CheckResult], Optional[str]]]],
+    ...,
+] = (
+    ("toolchain.vs", "Visual Studio", _fmt_vs, _note_vs),
+    ("toolchain.msvc", "MSVC toolsets", _fmt_details, None),
+    ("toolchain.windows_sdk", "Windows SDK", _fmt_details, _note_sdk),
+    ("toolchain.pdbcopy", "pdbcopy", _fmt_details, None),
+    ("toolchain.cmake", "CMake/Ninja", _fmt_details, None),
+    ("ue.redist", "VC++ Redist", _fmt_details, None),
+    ("ue.engine-build", "Engine build completeness", _fmt_summary_details, None),
+    ("ue.shader-distribution", "Shader distribution", _fmt_summary_details, None),
+    ("ue.ddc", "DDC", _fmt_summary_details, None),
+    ("horde.agent", "Horde agent", _fmt_summary_details, None),
+)
 
 
 def render_toolchain_summary(scan: ScanData, manifest) -> str:
     lines: List[str] = []
     notes: List[str] = []
-
-    vs = _get(scan, "toolchain.vs")
-    if vs:
-        vs_verification = "UNVERIFIED" if "UNVERIFIED" in vs.summary else vs.status.value
-        lines.append(_line("Visual Studio", f"{vs.details} (component verification: {vs_verification})"))
-        if "UNVERIFIED" in vs.summary:
-            notes.append("VS component list unavailable; validated via toolchain artifacts instead.")
-
-    msvc = _get(scan, "toolchain.msvc")
-    if msvc:
-        lines.append(_line("MSVC toolsets", msvc.details))
-
-    sdk = _get(scan, "toolchain.windows_sdk")
-    if sdk:
-        lines.append(_line("Windows SDK", sdk.details))
-        if sdk.status == CheckStatus.WARN:
-            notes.append(sdk.message)
-
-    pdbcopy = _get(scan, "toolchain.pdbcopy")
-    if pdbcopy:
-        lines.append(_line("pdbcopy", pdbcopy.details))
-
-    cmake = _get(scan, "toolchain.cmake")
-    if cmake:
-        lines.append(_line("CMake/Ninja", cmake.details))
-
-    redist = _get(scan, "ue.redist")
-    if redist:
-        lines.append(_line("VC++ Redist", redist.details))
-
-    engine = _get(scan, "ue.engine-build")
-    if engine:
-        lines.append(_line("Engine build completeness", f"{engine.summary} | {engine.details}"))
-
-    shader = _get(scan, "ue.shader-distribution")
-    if shader:
-        lines.append(_line("Shader distribution", f"{shader.summary} | {shader.details}"))
-
-    ddc = _get(scan, "ue.ddc")
-    if ddc:
-        lines.append(_line("DDC", f"{ddc.summary} | {ddc.details}"))
-
-    horde_agent = _get(scan, "horde.agent")
-    if horde_agent:
-        lines.append(_line("Horde agent", f"{horde_agent.summary} | {horde_agent.details}"))
+    index = _check_index(scan)
+
+    for check_id, label, formatter, note_extractor in _ROWS:
+        check = index.get(check_id)
+        if not check:
+            continue
+        lines.append(f"- {label}: {formatter(check)}")
+        if note_extractor:
+            note = note_extractor(check)
+            if note:
+                notes.append(note)
 
     if not lines:
         return ""
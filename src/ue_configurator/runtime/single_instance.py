@@ -21,9 +21,11 @@ def acquire_single_instance_lock(
     command: Optional[Sequence[str]] = None,
 ):
     """Acquire a single-instance lock. Raises SingleInstanceError on contention."""
-    resolved_log = Path(log_path) if log_path else None
-    resolved_lock_dir = Path(lock_dir) if lock_dir else None
-    resolved_repo = Path(repo_root) if repo_root else None
+    # Path() always constructs, even from a Path; skip it for callers that
+    # already pass resolved objects.
+    resolved_log = log_path if isinstance(log_path, Path) else (Path(log_path) if log_path else None)
+    resolved_lock_dir = lock_dir if isinstance(lock_dir, Path) else (Path(lock_dir) if lock_dir else None)
+    resolved_repo = repo_root if isinstance(repo_root, Path) else (Path(repo_root) if repo_root else None)
     return _acquire_single_instance_lock(
         app_name,
         resolved_log,
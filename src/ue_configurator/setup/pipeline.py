@@ -638,7 +638,7 @@ def run_setup(options: SetupOptions) -> int:
         source = options.manifest_source or "default"
         logger.log(
             f"[setup] Using manifest {options.manifest.describe()} "
-            f"(fingerprint {options.manifest.fingerprint[:12]}) from {source}"
+            f"(fingerprint {options.manifest.short_fingerprint}) from {source}"
         )
         if options.manifest_note:
             logger.log(f"[setup] {options.manifest_note}")
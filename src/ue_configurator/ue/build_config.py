@@ -5,6 +5,7 @@ from __future__ import annotations
 import difflib
 from dataclasses import dataclass, field
 import datetime
+import io
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
@@ -15,19 +16,23 @@ def _parse_bool(text: str) -> bool:
 
 
 def parse_build_configuration_flags(xml_text: str) -> Dict[str, bool]:
-    """Extract distributed build flags from BuildConfiguration.xml."""
+    """Extract distributed build flags from BuildConfiguration.xml.
+
+    Streams with ``iterparse`` and releases each element as it completes,
+    so large configs never hold a full DOM in memory.
+    """
 
     flags: Dict[str, bool] = {}
     try:
-        root = ET.fromstring(xml_text)
+        for _, elem in ET.iterparse(io.StringIO(xml_text), events=("end",)):
+            tag = elem.tag
+            if "}" in tag:
+                tag = tag.split("}", 1)[1]
+            if elem.text:
+                flags[tag] = _parse_bool(elem.text)
+            elem.clear()
     except ET.ParseError:
-        return flags
-    for elem in root.iter():
-        tag = elem.tag
-        if "}" in tag:
-            tag = tag.split("}", 1)[1]
-        if elem.text:
-            flags[tag] = _parse_bool(elem.text)
+        return {}
     return flags
 
 
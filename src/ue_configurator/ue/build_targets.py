@@ -65,6 +65,14 @@ def _resolve_targets(override: Sequence[str] | None) -> Sequence[BuildTarget]:
     return DEFAULT_TARGETS
 
 
+def canonical_binaries(
+    ue_root: Path, targets: Sequence[str] | None = None
+) -> List[tuple[BuildTarget, Path]]:
+    """Pair each target with its canonical binary path, without resolving."""
+
+    return [(target, target.binary_path(ue_root)) for target in _resolve_targets(targets)]
+
+
 def format_plan_line(item: TargetBuildPlan) -> str:
     suffix = f"{item.resolved or item.canonical}"
     if item.resolved and item.resolved != item.canonical:
@@ -9,12 +9,12 @@ import ue_configurator.probe.toolchain as toolchain
 def test_pdbcopy_probe_passes_when_found_on_path(monkeypatch) -> None:
     ctx = ProbeContext(dry_run=True)
 
-    def fake_run(command, **kwargs):
-        if command == ["where", "pdbcopy.exe"]:
-            return CommandResult(command, "C:\\Tools\\pdbcopy.exe\n", "", 0)
-        return CommandResult(command, "", "", 1)
+    def fake_which(name):
+        if name == "pdbcopy.exe":
+            return "C:\\Tools\\pdbcopy.exe"
+        return None
 
-    monkeypatch.setattr(ctx, "run_command", fake_run)
+    monkeypatch.setattr(toolchain, "_which", fake_which)
     monkeypatch.setattr(toolchain, "_pdbcopy_candidates", lambda: [])
 
     result = toolchain.check_pdbcopy(ctx)